@@ -14,9 +14,13 @@
 # NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
 # DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import hashlib
+import importlib.metadata
+import json
 import logging
 import os
-from dataclasses import dataclass
+import threading
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 import tomli  # tomli is for Python versions < 3.11 move to tomllib when 3.11+ is minimum
@@ -29,6 +33,10 @@ from .rules import get_rules_files
 
 logging.basicConfig(format="%(asctime)s %(message)s", datefmt="%m/%d/%Y %I:%M:%S %p", level=logging.INFO)
 logger = logging.getLogger("robocop-mcp")
+RULES_SNAPSHOT_FILE = "robocop_rules.json"
+# Increase when the snapshot content changes, so that old snapshots are not used.
+_RULES_SNAPSHOT_FORMAT = 1
+EXECUTOR_TYPES = ("thread", "process")
 
 
 @dataclass
@@ -50,22 +58,35 @@ class Config:
     robocop_configured: bool = False
     robocop_toml: Path | None = None
     robocop_reruns: int = 10
+    executor: str = "thread"
+    max_workers: int | None = None
+    parallel: bool = False
+    cache: bool = True
+    cache_size: int = 10000
+    fingerprint: str = ""
+    watch: bool = False
+    watch_path: Path | None = None
+    watch_debounce: int = 500
+    timeout: float | None = None
+    max_files: int | None = None
+    max_tasks_per_worker: int | None = None
+    priority_rules_first: bool = False
+    early_exit: bool = False
 
 
 def _get_robocop_rule_name(rule_id: str) -> str:
-    rule = ROBOCOP_RULES.get(rule_id)
+    rules = get_robocop_rules()
+    rule = rules.get(_RULE_IDS.get(rule_id.lower(), rule_id))
     if rule:
         return rule.name
     return rule_id.lower()
 
 
-def _get_rule_id_by_name_or_id(rule_name: str) -> str | None:
-    for rule in ROBOCOP_RULES.values():
-        if rule.name == rule_name:
-            return rule.rule_id
-        if rule.rule_id.lower() == rule_name.lower():
-            return rule.rule_id
-    return None
+def get_rule_id_by_name_or_id(rule_name: str) -> str | None:
+    """Return Robocop rule id for the rule name or id, case-insensitively. None if rule is not found."""
+    get_robocop_rules()
+    key = rule_name.lower()
+    return _RULE_NAMES.get(key) or _RULE_IDS.get(key)
 
 
 def _get_user_rule_fixes(config: dict) -> dict[str, Rule]:
@@ -73,7 +94,7 @@ def _get_user_rule_fixes(config: dict) -> dict[str, Rule]:
     if not config:
         return rules
     for key, value in config.items():
-        rule_id = _get_rule_id_by_name_or_id(key)
+        rule_id = get_rule_id_by_name_or_id(key)
         if rule_id is None:
             continue
         name = _get_robocop_rule_name(rule_id)
@@ -102,7 +123,7 @@ def _get_rule_priority(config: dict, pyproject_toml: Path) -> list[str]:
     if isinstance(rule_priority, str):
         logger.info("rule_priority in %s is string, converting to list", pyproject_toml)
         rule_priority = [rule_priority]
-    rule_priority = [_get_rule_id_by_name_or_id(rule) for rule in rule_priority]
+    rule_priority = [get_rule_id_by_name_or_id(rule) for rule in rule_priority]
     return [rule for rule in rule_priority if rule is not None]
 
 
@@ -111,7 +132,7 @@ def _get_rule_ignore(config: dict, pyproject_toml: Path) -> list[str]:
     if isinstance(rule_ignore, str):
         logger.info("ignore in %s is string, converting to list", pyproject_toml)
         rule_ignore = [rule_ignore]
-    rule_ignore = [_get_rule_id_by_name_or_id(rule) for rule in rule_ignore]
+    rule_ignore = [get_rule_id_by_name_or_id(rule) for rule in rule_ignore]
     return [rule for rule in rule_ignore if rule is not None]
 
 
@@ -172,14 +193,208 @@ def _get_reruns(config: dict) -> int:
     return reruns
 
 
-ROBOCOP_RULES = _get_robocop_rules()
+def get_cache_dir() -> Path:
+    cache_dir = os.environ.get("ROBOCOPMCP_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "robocop_mcp"
 
 
-def get_config() -> Config:
+def _get_rules_snapshot_key() -> str:
+    robocop_files = importlib.metadata.files("robotframework-robocop") or []
+    rule_files = sorted(
+        f"{file}:{file.hash.value if file.hash else ''}"
+        for file in robocop_files
+        if file.parts[:3] == ("robocop", "linter", "rules") and file.suffix == ".py"
+    )
+    key = [
+        str(_RULES_SNAPSHOT_FORMAT),
+        importlib.metadata.version("robotframework-robocop"),
+        importlib.metadata.version("robotframework"),
+        *rule_files,
+    ]
+    return hashlib.sha256("\n".join(key).encode("utf-8")).hexdigest()
+
+
+def _load_rules_snapshot(snapshot: Path, key: str) -> dict[str, Rule] | None:
+    try:
+        with snapshot.open("r", encoding="utf-8") as file:
+            data = json.load(file)
+        if data["key"] != key:
+            logger.info("Robocop rules snapshot %s is outdated", snapshot)
+            return None
+        return {rule["rule_id"]: Rule(**rule) for rule in data["rules"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_rules_snapshot(snapshot: Path, key: str, rules: dict[str, Rule]) -> None:
+    temp_file = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+    try:
+        snapshot.parent.mkdir(parents=True, exist_ok=True)
+        with temp_file.open("w", encoding="utf-8") as file:
+            json.dump({"key": key, "rules": [asdict(rule) for rule in rules.values()]}, file)
+        temp_file.replace(snapshot)
+    except OSError as error:
+        logger.warning("Could not write Robocop rules snapshot %s: %s", snapshot, error)
+
+
+def _get_cached_robocop_rules() -> dict[str, Rule]:
+    snapshot = get_cache_dir() / RULES_SNAPSHOT_FILE
+    key = _get_rules_snapshot_key()
+    rules = _load_rules_snapshot(snapshot, key)
+    if rules is not None:
+        logger.info("Loaded Robocop rules from %s", snapshot)
+        return rules
+    logger.info("Resolving Robocop rules")
+    rules = _get_robocop_rules()
+    _save_rules_snapshot(snapshot, key, rules)
+    return rules
+
+
+def _get_executor(config: dict, pyproject_toml: Path) -> str:
+    executor = config.get("executor", "thread")
+    if executor not in EXECUTOR_TYPES:
+        logger.warning(
+            "Invalid executor value '%s' in %s, using default thread",
+            executor,
+            pyproject_toml,
+        )
+        executor = "thread"
+    return executor
+
+
+def _get_max_workers(config: dict, pyproject_toml: Path) -> int | None:
+    max_workers = config.get("max_workers")
+    if max_workers is None:
+        return None
+    try:
+        max_workers = int(max_workers)
+    except (TypeError, ValueError):
+        max_workers = 0
+    if max_workers < 1:
+        logger.warning("Invalid max_workers value in %s, using default", pyproject_toml)
+        return None
+    return max_workers
+
+
+def _get_limit_setting(config: dict, name: str, pyproject_toml: Path) -> float | None:
+    value = config.get(name)
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        value = 0
+    if value <= 0:
+        logger.warning("Invalid %s value in %s, no limit is used", name, pyproject_toml)
+        return None
+    return value
+
+
+def _get_bool_setting(config: dict, name: str, pyproject_toml: Path, *, default: bool) -> bool:
+    value = config.get(name, default)
+    if isinstance(value, str):
+        logger.info("%s in %s is string, converting to bool", name, pyproject_toml)
+        value = value.lower() in ("true", "yes", "1")
+    return bool(value)
+
+
+def _get_int_setting(config: dict, name: str, pyproject_toml: Path, *, default: int) -> int:
+    value = config.get(name, default)
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        value = 0
+    if value < 1:
+        logger.warning("Invalid %s value in %s, using default %s", name, pyproject_toml, default)
+        return default
+    return value
+
+
+def _get_watch_path(config: dict, pyproject_toml: Path) -> Path:
+    watch_path = Path(config.get("watch_path", "."))
+    if not watch_path.is_absolute():
+        watch_path = pyproject_toml.parent / watch_path
+    return watch_path.resolve()
+
+
+def _get_file_hash(path: Path | None) -> str:
+    if path is None:
+        return ""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _get_config_fingerprint(pyproject_toml: Path | None, robocop_toml: Path | None) -> str:
+    parts = [
+        importlib.metadata.version("robotframework-robocop"),
+        _get_file_hash(pyproject_toml),
+        _get_file_hash(robocop_toml),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+_ROBOCOP_RULES: dict[str, Rule] = {}
+# Lower case rule ids and names mapped to rule id, built together with the catalog.
+_RULE_IDS: dict[str, str] = {}
+_RULE_NAMES: dict[str, str] = {}
+_ROBOCOP_RULES_LOCK = threading.Lock()
+
+
+def get_robocop_rules() -> dict[str, Rule]:
+    """Return the Robocop rule catalog, loading it on the first call."""
+    with _ROBOCOP_RULES_LOCK:
+        if not _ROBOCOP_RULES:
+            rules = _get_cached_robocop_rules()
+            _RULE_IDS.update({rule_id.lower(): rule_id for rule_id in rules})
+            _RULE_NAMES.update({rule.name.lower(): rule.rule_id for rule in rules.values()})
+            _ROBOCOP_RULES.update(rules)
+    return _ROBOCOP_RULES
+
+
+FileSignature = tuple[int, int] | None
+_CONFIG_CACHE: dict[tuple[Path | None, Path | None], tuple[tuple[FileSignature, ...], Config]] = {}
+
+
+def _get_file_signature(path: Path | None) -> FileSignature:
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def clear_config_cache() -> None:
+    """Drop cached configurations, next get_config call reads the toml files again."""
+    _CONFIG_CACHE.clear()
+
+
+def _get_config_paths() -> tuple[Path | None, Path | None]:
     pyproject_toml_env = os.environ.get("ROBOCOPMCP_CONFIG_FILE")
     pyproject_toml = Path(pyproject_toml_env).resolve() if pyproject_toml_env else None
     robocop_toml_env = os.environ.get("ROBOCOPMCP_ROBOCOP_CONFIG_FILE")
     robocop_toml = Path(robocop_toml_env).resolve() if robocop_toml_env else None
+    return pyproject_toml, robocop_toml
+
+
+def get_config() -> Config:
+    """Return configuration, cached until the toml files are changed, moved or removed."""
+    paths = _get_config_paths()
+    signature = tuple(_get_file_signature(path) for path in paths)
+    cached = _CONFIG_CACHE.get(paths)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    config = _load_config(*paths)
+    _CONFIG_CACHE[paths] = (signature, config)
+    return config
+
+
+def _load_config(pyproject_toml: Path | None, robocop_toml: Path | None) -> Config:
     predefined_fixes = _get_predefined_fixes()
     if pyproject_toml and pyproject_toml.is_file():
         with pyproject_toml.open("r+b") as file:
@@ -191,6 +406,21 @@ def get_config() -> Config:
         robocop_configured = _robocop_configured_in_toml(data, pyproject_toml, robocop_toml)
         ignore = _get_rule_ignore(robocop_mcp, pyproject_toml)
         reruns = _get_reruns(robocop_mcp)
+        executor = _get_executor(robocop_mcp, pyproject_toml)
+        max_workers = _get_max_workers(robocop_mcp, pyproject_toml)
+        parallel = _get_bool_setting(robocop_mcp, "parallel", pyproject_toml, default=False)
+        cache = _get_bool_setting(robocop_mcp, "cache", pyproject_toml, default=True)
+        cache_size = _get_int_setting(robocop_mcp, "cache_size", pyproject_toml, default=10000)
+        watch = _get_bool_setting(robocop_mcp, "watch", pyproject_toml, default=False)
+        watch_path = _get_watch_path(robocop_mcp, pyproject_toml)
+        watch_debounce = _get_int_setting(robocop_mcp, "watch_debounce", pyproject_toml, default=500)
+        timeout = _get_limit_setting(robocop_mcp, "timeout", pyproject_toml)
+        max_files = _get_limit_setting(robocop_mcp, "max_files", pyproject_toml)
+        max_tasks_per_worker = _get_limit_setting(robocop_mcp, "max_tasks_per_worker", pyproject_toml)
+        priority_rules_first = _get_bool_setting(
+            robocop_mcp, "priority_rules_first", pyproject_toml, default=False
+        )
+        early_exit = _get_bool_setting(robocop_mcp, "early_exit", pyproject_toml, default=False)
     else:
         logger.info("No pyproject.toml file found, using default configuration.")
         user_rules = {}
@@ -199,17 +429,44 @@ def get_config() -> Config:
         robocop_configured = False
         ignore = []
         reruns = 10
+        executor = "thread"
+        max_workers = None
+        parallel = False
+        cache = True
+        cache_size = 10000
+        watch = False
+        watch_path = None
+        watch_debounce = 500
+        timeout = None
+        max_files = None
+        max_tasks_per_worker = None
+        priority_rules_first = False
+        early_exit = False
     return Config(
         pyproject_toml,
         user_rules,
         predefined_fixes,
-        ROBOCOP_RULES,
+        get_robocop_rules(),
         count,
         rule_priority,
         ignore,
         robocop_configured,
         robocop_toml,
         reruns,
+        executor=executor,
+        max_workers=max_workers,
+        parallel=parallel,
+        cache=cache,
+        cache_size=cache_size,
+        fingerprint=_get_config_fingerprint(pyproject_toml, robocop_toml),
+        watch=watch,
+        watch_path=watch_path,
+        watch_debounce=watch_debounce,
+        timeout=timeout,
+        max_files=max(1, int(max_files)) if max_files is not None else None,
+        max_tasks_per_worker=max(1, int(max_tasks_per_worker)) if max_tasks_per_worker is not None else None,
+        priority_rules_first=priority_rules_first,
+        early_exit=early_exit,
     )
 
 
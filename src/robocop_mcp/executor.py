@@ -0,0 +1,193 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+import typer
+from robocop.run import format_files  # type: ignore
+
+from .config import Config, logger, set_robocop_config_file
+from .linter import get_linter
+
+T = TypeVar("T")
+
+_EXECUTORS: dict[tuple[str, int | None], Executor] = {}
+# Configuration fingerprint which the process pool workers were warmed up with.
+_POOL_FINGERPRINTS: dict[tuple[str, int | None], str] = {}
+# Reentrant, because jobs are submitted under the lock, see _submit.
+_EXECUTORS_LOCK = threading.RLock()
+_WARM_UP_SOURCE = "*** Test Cases ***\nWarm Up\n    No Operation\n"
+
+
+@dataclass
+class _SharedCall:
+    future: "asyncio.Future[Any]"
+    waiters: int = 0
+
+
+_IN_FLIGHT: dict[Hashable, _SharedCall] = {}
+
+
+def _init_worker(configuration_file: Path | None, fingerprint: str) -> None:
+    """Import Robocop, load the rule catalog and resolve the configuration before the first job."""
+    kwargs: dict[str, Any] = {"silent": True, "cache": False}
+    if configuration_file is not None:
+        kwargs["configuration_file"] = configuration_file
+    try:
+        with tempfile.TemporaryDirectory(prefix="robocop-mcp-") as directory:
+            source = Path(directory) / "warm_up.robot"
+            source.write_text(_WARM_UP_SOURCE, encoding="utf-8")
+            get_linter(configuration_file, fingerprint).check_files([source])
+            with contextlib.suppress(typer.Exit):
+                format_files(sources=[source], **kwargs)
+    except Exception as error:  # noqa: BLE001
+        logger.warning("Could not warm up worker: %s", error)
+
+
+def _create_process_pool(config: Config) -> ProcessPoolExecutor:
+    options: dict[str, Any] = {}
+    if config.max_tasks_per_worker is not None:
+        if sys.version_info >= (3, 11):
+            options["max_tasks_per_child"] = config.max_tasks_per_worker
+        else:
+            logger.warning("max_tasks_per_worker requires Python 3.11 or newer, setting is ignored")
+    configuration_file = set_robocop_config_file(config, {}).get("configuration_file")
+    # Server runs many threads, forked worker could inherit a lock held by one of them.
+    return ProcessPoolExecutor(
+        max_workers=config.max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(configuration_file, config.fingerprint),
+        **options,
+    )
+
+
+def _get_executor(executor_type: str, config: Config) -> Executor:
+    key = (executor_type, config.max_workers)
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(key)
+        if (
+            executor is not None
+            and executor_type == "process"
+            and _POOL_FINGERPRINTS[key] != config.fingerprint
+        ):
+            logger.info("Configuration changed, rebuilding process pool")
+            # Jobs already submitted to the old pool are completed before its workers exit.
+            executor.shutdown(wait=False)
+            executor = None
+        if executor is None:
+            logger.info("Creating %s executor with max_workers %s", executor_type, config.max_workers)
+            if executor_type == "process":
+                executor = _create_process_pool(config)
+                _POOL_FINGERPRINTS[key] = config.fingerprint
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=config.max_workers, thread_name_prefix="robocop-mcp"
+                )
+            _EXECUTORS[key] = executor
+        return executor
+
+
+def get_executor(config: Config) -> Executor:
+    """Return executor for running Robocop, executors are created once and shared between calls."""
+    return _get_executor(config.executor, config)
+
+
+def get_process_executor(config: Config) -> Executor:
+    """Return process pool executor, used when work is split between CPU cores.
+
+    Workers are warmed up when they are started and the pool is rebuilt when the configuration changes.
+    """
+    return _get_executor("process", config)
+
+
+def _ready() -> None:
+    pass
+
+
+def _submit(executor_type: str, config: Config, func: Callable[..., T], *args: Any) -> "Future[T]":  # noqa: ANN401
+    # Executor is taken and the job submitted under the lock, so that a concurrent call with
+    # a changed configuration can not shut down the pool between them.
+    with _EXECUTORS_LOCK:
+        return _get_executor(executor_type, config).submit(partial(func, *args))
+
+
+def start_process_pool(config: Config) -> None:
+    """Start and warm up the process pool workers, so that the first jobs do not wait for them."""
+    workers = config.max_workers or os.cpu_count() or 1
+    logger.info("Starting %s process pool workers", workers)
+    for _ in range(workers):
+        _submit("process", config, _ready)
+
+
+async def run_in_executor(config: Config, func: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+    return await asyncio.wrap_future(_submit(config.executor, config, func, *args))
+
+
+async def run_in_process_pool(config: Config, func: Callable[..., T], *args: Any) -> T:  # noqa: ANN401
+    """Run func in the process pool, used when work is split between CPU cores."""
+    return await asyncio.wrap_future(_submit("process", config, func, *args))
+
+
+async def run_single_flight(key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+    """Run func only once for concurrent calls with the same key, all callers get the same result.
+
+    Running call is cancelled only when all callers are cancelled, so that the other
+    callers still get the result.
+    """
+    call = _IN_FLIGHT.get(key)
+    if call is None or call.future.get_loop() is not asyncio.get_running_loop():
+        call = _SharedCall(asyncio.ensure_future(func()))
+        _IN_FLIGHT[key] = call
+
+        def remove(done: "asyncio.Future[Any]") -> None:
+            shared = _IN_FLIGHT.get(key)
+            if shared is not None and shared.future is done:
+                del _IN_FLIGHT[key]
+
+        call.future.add_done_callback(remove)
+    else:
+        logger.info("Joining running call for %s", key)
+    call.waiters += 1
+    try:
+        return await asyncio.shield(call.future)
+    except asyncio.CancelledError:
+        if call.waiters == 1:
+            logger.info("All callers cancelled, cancelling call for %s", key)
+            call.future.cancel()
+        raise
+    finally:
+        call.waiters -= 1
+
+
+def shutdown_executors() -> None:
+    with _EXECUTORS_LOCK:
+        for executor in _EXECUTORS.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        _EXECUTORS.clear()
+        _POOL_FINGERPRINTS.clear()
@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from .config import logger
+
+CACHE_DATABASE = "file_cache.sqlite"
+# SQLite limits the number of variables in one statement.
+_CHUNK_SIZE = 500
+
+
+def hash_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class FileCache:
+    """
+    Per file cache, stored in SQLite database in the cache directory.
+
+    Each file has one entry per cache kind. Entry is returned only when the stored
+    key matches the key given by the caller, key is usually built from the file content
+    hash and the configuration fingerprint. When the cache grows over max_entries,
+    least recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: Path, kind: str, max_entries: int) -> None:
+        self.database = cache_dir / CACHE_DATABASE
+        self.kind = kind
+        self.max_entries = max_entries
+
+    def _connect(self) -> sqlite3.Connection:
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS file_cache ("
+            "kind TEXT NOT NULL, path TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "used REAL NOT NULL, PRIMARY KEY (kind, path))"
+        )
+        return connection
+
+    def get(self, keys: dict[Path, str]) -> dict[Path, str]:
+        """Return cached values for the files which stored key matches."""
+        found: dict[Path, str] = {}
+        paths = {str(path): path for path in keys}
+        names = list(paths)
+        try:
+            with closing(self._connect()) as connection, connection:
+                for index in range(0, len(names), _CHUNK_SIZE):
+                    chunk = names[index : index + _CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    query = (
+                        f"SELECT path, key, value FROM file_cache WHERE kind = ? AND path IN ({placeholders})"  # noqa: S608
+                    )
+                    rows = connection.execute(query, [self.kind, *chunk]).fetchall()
+                    for name, key, value in rows:
+                        if keys[paths[name]] == key:
+                            found[paths[name]] = value
+                connection.executemany(
+                    "UPDATE file_cache SET used = ? WHERE kind = ? AND path = ?",
+                    [(time.time(), self.kind, str(path)) for path in found],
+                )
+        except (OSError, sqlite3.Error) as error:
+            logger.warning("Could not read cache %s: %s", self.database, error)
+            return {}
+        return found
+
+    def set(self, values: dict[Path, tuple[str, str]]) -> None:
+        """Store key and value for each file and evict the least recently used entries."""
+        if not values:
+            return
+        now = time.time()
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO file_cache (kind, path, key, value, used) VALUES (?, ?, ?, ?, ?)",
+                    [(self.kind, str(path), key, value, now) for path, (key, value) in values.items()],
+                )
+                connection.execute(
+                    "DELETE FROM file_cache WHERE kind = ? AND path NOT IN "
+                    "(SELECT path FROM file_cache WHERE kind = ? ORDER BY used DESC LIMIT ?)",
+                    (self.kind, self.kind, self.max_entries),
+                )
+        except (OSError, sqlite3.Error) as error:
+            logger.warning("Could not write cache %s: %s", self.database, error)
+
+    def clear(self) -> None:
+        try:
+            with closing(self._connect()) as connection, connection:
+                connection.execute("DELETE FROM file_cache WHERE kind = ?", (self.kind,))
+        except (OSError, sqlite3.Error) as error:
+            logger.warning("Could not clear cache %s: %s", self.database, error)
@@ -0,0 +1,86 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import shutil
+import subprocess
+from pathlib import Path
+
+from .config import logger
+from .watch import WATCHED_SUFFIXES
+
+
+class GitError(Exception):
+    pass
+
+
+def _run_git(cwd: Path, *args: str) -> str:
+    git = shutil.which("git")
+    if git is None:
+        msg = "git executable not found"
+        raise GitError(msg)
+    try:
+        result = subprocess.run(  # noqa: S603
+            [git, *args], cwd=cwd, capture_output=True, text=True, check=True, encoding="utf-8"
+        )
+    except subprocess.CalledProcessError as error:
+        msg = f"git {' '.join(args)} failed: {error.stderr.strip()}"
+        raise GitError(msg) from error
+    except OSError as error:
+        msg = f"git {' '.join(args)} failed: {error}"
+        raise GitError(msg) from error
+    return result.stdout
+
+
+def _split_paths(output: str) -> list[str]:
+    return [path for path in output.split("\0") if path]
+
+
+def _resolve_commit(root: Path, ref: str) -> str:
+    """Return commit id of the ref, ref comes from the client, so it must not be read as an option."""
+    if not ref or ref.startswith("-"):
+        msg = f"invalid git ref: {ref!r}"
+        raise GitError(msg)
+    return _run_git(root, "rev-parse", "--verify", "--end-of-options", f"{ref}^{{commit}}").strip()
+
+
+def get_changed_files(path: Path, ref: str) -> list[Path]:
+    """Return Robot Framework files under path which differ from the git ref, or are staged or untracked.
+
+    Deleted files are not returned. Use HEAD as ref to get only the uncommitted changes.
+    """
+    if not path.exists():
+        msg = f"path does not exist: {path}"
+        raise GitError(msg)
+    directory = path if path.is_dir() else path.parent
+    root = Path(_run_git(directory, "rev-parse", "--show-toplevel").strip())
+    commit = _resolve_commit(root, ref)
+    changed = _split_paths(
+        _run_git(root, "diff", "--name-only", "-z", "--diff-filter=d", "--end-of-options", commit, "--")
+    )
+    changed += _split_paths(_run_git(root, "diff", "--name-only", "-z", "--diff-filter=d", "--cached", "--"))
+    changed += _split_paths(_run_git(root, "ls-files", "--others", "--exclude-standard", "-z"))
+    resolved = path.resolve()
+    files = []
+    for name in dict.fromkeys(changed):
+        file = (root / name).resolve()
+        if (
+            file.suffix in WATCHED_SUFFIXES
+            and file.is_file()
+            and (file == resolved or resolved in file.parents)
+        ):
+            files.append(file)
+    logger.info("Found %s changed files compared to %s", len(files), ref)
+    return files
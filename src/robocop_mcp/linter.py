@@ -0,0 +1,148 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import functools
+import threading
+import types
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+from robocop.config import schema  # type: ignore
+from robocop.config.manager import ConfigManager  # type: ignore
+from robocop.linter.diagnostics import Diagnostic  # type: ignore
+from robocop.linter.runner import RobocopLinter  # type: ignore
+from robocop.source_file import SourceFile  # type: ignore
+from robot.errors import DataError  # type: ignore
+
+from .config import logger
+
+
+class CachedLinter:
+    """Robocop linter which keeps the resolved rules between checks.
+
+    Robocop check_files resolves the configuration and loads the rules again in every call.
+    This linter reads the configuration files in every call, so changes in them are seen, but
+    the rules are resolved only once per configuration, by the configuration hash. Checkers
+    are not thread safe, so one file is checked at the time.
+    """
+
+    def __init__(self, configuration_file: Path | None) -> None:
+        self.configuration_file = configuration_file
+        self.overwrite_config = schema.RawConfig(
+            linter=schema.RawLinterConfig(return_result=True),
+            cache=schema.RawCacheConfig(enabled=False),
+            silent=True,
+        )
+        self.linter = RobocopLinter(self._get_config_manager(None))
+        self.lock = threading.Lock()
+
+    def _get_config_manager(self, sources: list[Path] | None) -> ConfigManager:
+        return ConfigManager(
+            sources=sources, config=self.configuration_file, overwrite_config=self.overwrite_config
+        )
+
+    def check_files(
+        self, files: list[Path], rules: frozenset[str] = frozenset(), cancelled: threading.Event | None = None
+    ) -> list[Diagnostic]:
+        """Check files, when rules are given only the checkers of the rules are run.
+
+        When cancelled is set, the files which are not yet checked are left out.
+        """
+        diagnostics: list[Diagnostic] = []
+        config_manager = self._get_config_manager(files)
+        for index, file in enumerate(files):
+            if cancelled is not None and cancelled.is_set():
+                logger.info(
+                    "Check cancelled, %s of %s files were not checked", len(files) - index, len(files)
+                )
+                break
+            source_file = SourceFile(file, config_manager.get_config_for_source_file(file))
+            try:
+                # The lock is held per file, so other calls sharing the linter are not blocked
+                # until every file of a large check is done.
+                with self.lock:
+                    diagnostics.extend(self._run_check(source_file, rules))
+            except DataError as error:
+                logger.warning("Failed to decode %s with an error: %s. Skipping file", file, error)
+        return diagnostics
+
+    def _run_check(self, source_file: SourceFile, rules: frozenset[str]) -> list[Diagnostic]:
+        if not rules:
+            return self.linter.run_check(source_file)
+        # Checkers are selected from the resolved configuration, so rules which are not enabled
+        # in the configuration are not enabled by selecting them.
+        resolved_config = self.linter.config_resolver.resolve_config(source_file.config)
+        checkers, after_run_checkers = resolved_config.checkers, resolved_config.after_run_checkers
+        resolved_config.checkers = [checker for checker in checkers if not rules.isdisjoint(checker.rules)]
+        resolved_config.after_run_checkers = [
+            checker for checker in after_run_checkers if not rules.isdisjoint(checker.rules)
+        ]
+        try:
+            diagnostics = self.linter.run_check(source_file)
+        finally:
+            resolved_config.checkers, resolved_config.after_run_checkers = checkers, after_run_checkers
+        return [diagnostic for diagnostic in diagnostics if diagnostic.rule.rule_id in rules]
+
+    def check_text(self, text: str, path: Path) -> list[Diagnostic]:
+        """Check source text as it would be the content of the file in path."""
+        config_manager = self._get_config_manager([path])
+        with self.lock:
+            source_file = SourceFile(
+                path,
+                config_manager.get_config_for_source_file(path),
+                _source_lines=text.splitlines(keepends=True),
+            )
+            source_file._model = source_file._load_model(StringIO(text))  # noqa: SLF001
+            resolved_config = self.linter.config_resolver.resolve_config(source_file.config)
+            # Rule modules are loaded by Robocop, so the checker is found by the method name.
+            bom_checkers = [checker for checker in resolved_config.checkers if hasattr(checker, "detect_bom")]
+            for checker in bom_checkers:
+                checker.detect_bom = types.MethodType(_detect_bom_in_text, checker)
+            try:
+                return self.linter.run_check(source_file)
+            finally:
+                for checker in bom_checkers:
+                    del checker.detect_bom
+
+
+def _detect_bom_in_text(checker: Any, _: Path) -> None:  # noqa: ANN401
+    # Robocop reads the BOM from the file, text in memory has it as the first character.
+    lines = checker.source_file.source_lines
+    checker.is_bom = bool(lines) and lines[0].startswith("\ufeff")
+    if checker.is_bom:
+        checker.report(checker.bom_encoding_in_file, lineno=1, col=1)
+
+
+def _get_file_signature(path: Path | None) -> str:
+    if path is None:
+        return ""
+    try:
+        stat = path.stat()
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_linter(configuration_file: Path | None, signature: str, fingerprint: str) -> CachedLinter:  # noqa: ARG001
+    logger.info("Creating Robocop linter with configuration file: %s", configuration_file)
+    return CachedLinter(configuration_file)
+
+
+def get_linter(configuration_file: Path | None, fingerprint: str) -> CachedLinter:
+    """Return cached linter, linter is created again when the configuration file or fingerprint change."""
+    return _get_linter(configuration_file, _get_file_signature(configuration_file), fingerprint)
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import difflib
+import functools
+import threading
+from io import StringIO
+from pathlib import Path
+
+from robocop.config import schema  # type: ignore
+from robocop.config.manager import ConfigManager  # type: ignore
+from robocop.formatter.runner import RobocopFormatter  # type: ignore
+from robocop.source_file import SourceFile  # type: ignore
+
+from .config import get_config, logger, set_robocop_config_file
+from .linter import get_linter
+from .mcp_check import Violation, convert_to_violations
+
+DEFAULT_FILE_NAME = "buffer.robot"
+
+
+class _BufferFormatter:
+    """Robocop formatter which formats source text in memory, without writing it to the disk."""
+
+    def __init__(self, configuration_file: Path | None, reruns: int) -> None:
+        self.configuration_file = configuration_file
+        self.overwrite_config = schema.RawConfig(
+            formatter=schema.RawFormatterConfig(reruns=reruns, return_result=True),
+            cache=schema.RawCacheConfig(enabled=False),
+            silent=True,
+        )
+        self.formatter = RobocopFormatter(self._get_config_manager(None))
+        self.lock = threading.Lock()
+
+    def _get_config_manager(self, sources: list[Path] | None) -> ConfigManager:
+        # Configuration files found from the folders are cached by the config manager, so a new
+        # manager is used for each call to see the changes in them.
+        return ConfigManager(
+            sources=sources, config=self.configuration_file, overwrite_config=self.overwrite_config
+        )
+
+    def format(self, text: str, path: Path) -> str:
+        config_manager = self._get_config_manager([path])
+        with self.lock:
+            source_file = SourceFile(path, config_manager.get_config_for_source_file(path))
+            source_file._model = source_file._load_model(StringIO(text))  # noqa: SLF001
+            # Formatter reads reruns and disablers from the configuration of the formatted file.
+            self.formatter.config = source_file.config
+            diff, _, new_model, _ = self.formatter.format_until_stable(source_file)
+        return new_model.text if diff else text
+
+
+@functools.lru_cache(maxsize=8)
+def _get_buffer_formatter(configuration_file: Path | None, reruns: int, fingerprint: str) -> _BufferFormatter:  # noqa: ARG001
+    logger.info("Creating Robocop formatter for source text with configuration file: %s", configuration_file)
+    return _BufferFormatter(configuration_file, reruns)
+
+
+def resolve_buffer_path(file_name: str | None) -> Path:
+    """Return absolute path for the virtual file, relative names are resolved from the current directory."""
+    path = Path(file_name or DEFAULT_FILE_NAME)
+    return path if path.is_absolute() else Path.cwd() / path
+
+
+def lint_text(text: str, file_name: str | None = None) -> list[Violation]:
+    """Check Robot Framework source text with the effective configuration, without a file on the disk.
+
+    The file name decides the file type and which Robocop configuration is used, the file
+    does not need to exist.
+    """
+    config = get_config()
+    kwargs = set_robocop_config_file(config, {})
+    linter = get_linter(kwargs.get("configuration_file"), config.fingerprint)
+    return convert_to_violations(linter.check_text(text, resolve_buffer_path(file_name)))
+
+
+def format_text(text: str, file_name: str | None = None) -> str:
+    """Format Robot Framework source text with the configured formatters and reruns, in memory."""
+    config = get_config()
+    kwargs = set_robocop_config_file(config, {})
+    formatter = _get_buffer_formatter(
+        kwargs.get("configuration_file"), config.robocop_reruns, config.fingerprint
+    )
+    return formatter.format(text, resolve_buffer_path(file_name))
+
+
+def diff_text(text: str, formatted: str, file_name: str | None = None) -> str:
+    name = file_name or DEFAULT_FILE_NAME
+    # Lines are compared without line endings, like in the Robocop diff output.
+    lines = difflib.unified_diff(
+        [line + "\n" for line in text.splitlines()],
+        [line + "\n" for line in formatted.splitlines()],
+        fromfile=f"{name}\tbefore",
+        tofile=f"{name}\tafter",
+    )
+    return "".join(lines)
@@ -15,16 +15,44 @@
 # DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from dataclasses import dataclass
+import asyncio
+import functools
+import heapq
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, TypeVar
 
+from robocop.config.manager import ConfigManager  # type: ignore
 from robocop.linter.diagnostics import Diagnostic  # type: ignore
-from robocop.run import check_files  # type: ignore
+from robocop.source_file import SourceFile  # type: ignore
 
-from .config import Config, get_config, logger, set_robocop_config_file
+from .config import Config, get_cache_dir, get_config, logger, set_robocop_config_file
+from .executor import run_in_executor, run_in_process_pool, run_single_flight
+from .file_cache import FileCache, hash_file
+from .git_changes import get_changed_files
+from .linter import get_linter
 
+T = TypeVar("T")
 
-@dataclass
+# Called with number of processed files, total number of files and violations found so far.
+ProgressCallback = Callable[[int, int, int], Awaitable[None]]
+# Files checked in one Robocop call when progress is reported or timeout is set.
+CHECK_BATCH_SIZE = 50
+# Batches are this many times larger without progress and timeout, when a cancelled call
+# stops the running batch between files.
+QUIET_BATCH_FACTOR = 10
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+@dataclass(frozen=True, slots=True)
 class Violation:
     file: Path
     start_line: int
@@ -36,33 +64,607 @@ class Violation:
     description: str
 
 
-def _convert_to_violations(result: list[Diagnostic]) -> list[Violation]:
+@functools.lru_cache(maxsize=16384)
+def _get_path(path: str) -> Path:
+    return Path(path)
+
+
+def convert_to_violations(result: list[Diagnostic]) -> list[Violation]:
+    """Convert diagnostics to violations.
+
+    Paths and strings repeat in large results, so same objects are shared between violations.
+    """
     logger.info("Convert to violations")
     return [
         Violation(
-            file=Path(item.source.path),
+            file=_get_path(str(item.source.path)),
             start_line=item.range.start.line,
             end_line=item.range.end.line,
             start_column=item.range.start.character,
             end_column=item.range.end.character,
-            severity=item.severity.name,
-            rule_id=item.rule.rule_id,
-            description=item.message,
+            severity=sys.intern(item.severity.name),
+            rule_id=sys.intern(item.rule.rule_id),
+            description=sys.intern(item.message),
         )
         for item in result
     ]
 
 
-async def run_robocop(path: str) -> list[Violation]:
+def _get_check_kwargs(config: Config, sources: list[Path]) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {"sources": sources, "fingerprint": config.fingerprint}
+    return set_robocop_config_file(config, kwargs)
+
+
+@dataclass
+class WorkBudget:
+    """Limits the files and the time used by one call, files left out are counted as skipped."""
+
+    max_files: int | None = None
+    timeout: float | None = None
+    stop_early: bool = False
+    total: int = 0
+    skipped: int = 0
+    reasons: list[str] = field(default_factory=list)
+    # Set when the call is cancelled, batches running in threads stop between files.
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+    def __post_init__(self) -> None:
+        self._deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+    @classmethod
+    def from_config(cls, config: Config, *, stop_early: bool = False) -> "WorkBudget":
+        return cls(config.max_files, config.timeout, stop_early)
+
+    @property
+    def limited(self) -> bool:
+        return self.max_files is not None or self.timeout is not None
+
+    def limit(self, files: list[Path]) -> list[Path]:
+        """Return files which fit in max_files, first files in the path order are selected."""
+        self.total = len(files)
+        if self.max_files is None or len(files) <= self.max_files:
+            return files
+        self.skip(len(files) - self.max_files, f"max_files limit {self.max_files} reached")
+        selected = set(sorted(files)[: self.max_files])
+        return [file for file in files if file in selected]
+
+    def expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def remaining(self) -> float | None:
+        return max(0.0, self._deadline - time.monotonic()) if self._deadline is not None else None
+
+    def skip(self, files: int, reason: str) -> None:
+        self.skipped += files
+        if reason not in self.reasons:
+            self.reasons.append(reason)
+
+    def skip_expired(self, files: int) -> None:
+        self.skip(files, f"timeout of {self.timeout:g} seconds reached")
+
+    def note(self, action: str) -> str:
+        if not self.skipped:
+            return ""
+        reasons = ", ".join(self.reasons)
+        return f"Partial result, {self.skipped} of {self.total} files were not {action}: {reasons}."
+
+
+@dataclass
+class ProgressCounter:
+    callback: ProgressCallback | None
+    total: int
+    done: int = 0
+    violations: int = 0
+    budget: WorkBudget = field(default_factory=WorkBudget)
+
+    async def update(self, files: int, violations: int) -> None:
+        self.done += files
+        self.violations += violations
+        if self.callback is not None:
+            await self.callback(self.done, self.total, self.violations)
+
+
+class CheckResult(list[Violation]):
+    """Violations found by the check, note tells how many files were not checked and why."""
+
+    note: str = ""
+
+
+async def run_robocop(
+    path: str,
+    progress: ProgressCallback | None = None,
+    git_ref: str | None = None,
+    *,
+    rules: tuple[str, ...] = (),
+    stop_early: bool = False,
+) -> CheckResult:
+    """Check files in path, when git_ref is given only files changed compared to the ref are checked.
+
+    When rules are given, only the checkers of the rules are run and only their violations are
+    returned. When stop_early is true, files are checked in order until the rule selected for the
+    report has violation_count violations. Concurrent calls with the same arguments and configuration
+    share one check. Progress is reported only to the caller which started the check. When the
+    max_files or timeout limit is reached, the rest of the files are not checked and the result has a note.
+    """
+    config = get_config()
+    key = get_call_key("check-early" if stop_early else "check", path, config, git_ref, rules)
+    counter = ProgressCounter(progress, 0, budget=WorkBudget.from_config(config, stop_early=stop_early))
+    return await run_single_flight(
+        key, functools.partial(_run_robocop, config, path, counter, git_ref, rules)
+    )
+
+
+async def _run_robocop(
+    config: Config, path: str, counter: ProgressCounter, git_ref: str | None, rules: tuple[str, ...]
+) -> CheckResult:
     sources = [Path(path)]
-    kwargs = {"sources": sources, "return_result": True, "silent": True}
+    kwargs = _get_check_kwargs(config, sources)
+    if rules:
+        kwargs["rules"] = frozenset(rules)
+    if git_ref is not None:
+        files = await asyncio.to_thread(discover_changed_files, sources[0], git_ref, kwargs)
+    elif not config.cache and not sources[0].is_dir():
+        logger.info("Running Robocop check with kwargs: %s", kwargs)
+        violations = await run_in_executor(config, _check_files, kwargs)
+        counter.total = 1
+        await counter.update(1, len(violations))
+        return CheckResult(violations)
+    else:
+        files = await asyncio.to_thread(discover_files, sources, kwargs.get("configuration_file"))
+    return await _check_discovered(config, kwargs, files, counter)
+
+
+async def run_robocop_batch(sources: list[Path], progress: ProgressCallback | None = None) -> CheckResult:
+    """Check files and folders in sources together, with one configuration resolution.
+
+    Files are checked in batches and in parallel, like with run_robocop, and cached results are used.
+    """
     config = get_config()
-    kwargs = set_robocop_config_file(config, kwargs)
-    logger.info("Running Robocop check_files with kwargs: %s", kwargs)
-    result = check_files(**kwargs)
-    if result is None:
+    key = ("check-batch", tuple(str(source) for source in sources), config.fingerprint)
+    counter = ProgressCounter(progress, 0, budget=WorkBudget.from_config(config))
+    return await run_single_flight(key, functools.partial(_run_robocop_batch, config, sources, counter))
+
+
+async def _run_robocop_batch(config: Config, sources: list[Path], counter: ProgressCounter) -> CheckResult:
+    kwargs = _get_check_kwargs(config, sources)
+    files = await asyncio.to_thread(discover_files, sources, kwargs.get("configuration_file"))
+    return await _check_discovered(config, kwargs, files, counter)
+
+
+async def _check_discovered(
+    config: Config, kwargs: dict, files: dict[Path, str], counter: ProgressCounter
+) -> CheckResult:
+    rules = kwargs.get("rules", frozenset())
+    budget = counter.budget
+    selected = budget.limit(list(files))
+    cached: dict[Path, list[Violation]] = {}
+    keys: dict[Path, str] = {}
+    if config.cache:
+        cached, keys = await asyncio.to_thread(
+            _get_cached_violations, config, {file: files[file] for file in selected}
+        )
+        logger.info("Found cached results for %s of %s files", len(cached), len(selected))
+        if rules:
+            # Cached results of the full check contain the results of the rules.
+            cached = {
+                file: [item for item in items if item.rule_id in rules] for file, items in cached.items()
+            }
+    counter.total = len(selected)
+    if cached:
+        await counter.update(len(cached), sum(len(violations) for violations in cached.values()))
+    if budget.stop_early:
+        violations, checked_files = await _check_until_enough(config, kwargs, selected, cached, counter)
+    else:
+        missing = [file for file in selected if file not in cached]
+        violations, checked_files = await _check_sources(config, kwargs, missing, counter)
+    checked = _group_by_file(violations)
+    if config.cache and not rules:
+        checked_keys = {file: keys[file] for file in checked_files if file in keys}
+        await asyncio.to_thread(_set_cached_violations, config, checked_keys, checked)
+    result = CheckResult(_merge_violations(selected, {**cached, **checked}))
+    result.note = budget.note("checked")
+    if result.note:
+        logger.warning(result.note)
+    return result
+
+
+def check_files_to_cache(paths: list[Path]) -> None:
+    """Check files in paths which do not have cached results and store the results in the cache.
+
+    Used by the watch mode to check the watched folder at start and the changed files after it.
+    Robocop file filters and gitignore are applied also to the given paths. Files are checked in
+    batches and the results are stored after each batch, so the linter is not held by one long call.
+    """
+    config = get_config()
+    if not config.cache:
+        return
+    existing = [path for path in paths if path.exists()]
+    if not existing:
+        return
+    kwargs = _get_check_kwargs(config, existing)
+    root = config.watch_path or Path.cwd()
+    discovered = discover_files(existing, kwargs.get("configuration_file"), root=root)
+    cached, keys = _get_cached_violations(config, discovered)
+    missing = [file for file in discovered if file not in cached]
+    if not missing:
+        return
+    logger.info("Checking %s changed files", len(missing))
+    for batch in split_into_batches(missing, math.ceil(len(missing) / CHECK_BATCH_SIZE)):
+        violations = _check_files({**kwargs, "sources": batch})
+        batch_keys = {file: keys[file] for file in batch if file in keys}
+        _set_cached_violations(config, batch_keys, _group_by_file(violations))
+
+
+async def _check_sources(
+    config: Config, kwargs: dict, files: list[Path], counter: ProgressCounter
+) -> tuple[list[Violation], list[Path]]:
+    """Check files in batches, progress is updated after each batch. Returns violations and checked files.
+
+    Timeout stops the check before the next batch. Cancel stops also the running batch between
+    files, when the batch is checked in a thread, in the process pool the batch is completed.
+    """
+    parallel = config.parallel and len(files) > 1
+    stoppable = not parallel and config.executor == "thread"
+    batch_count = get_batch_count(files, CHECK_BATCH_SIZE, counter, stoppable=stoppable)
+    if parallel:
+        workers = config.max_workers or os.cpu_count() or 1
+        batches = split_into_shards(files, max(workers, batch_count))
+        logger.info("Running Robocop check for %s files in %s shards", len(files), len(batches))
+    else:
+        workers = 1
+        batches = split_into_batches(files, batch_count)
+        logger.info("Running Robocop check for %s files in %s batches", len(files), batch_count)
+
+    async def check_batch(batch: list[Path]) -> list[Violation]:
+        batch_kwargs = {**kwargs, "sources": batch}
+        if stoppable:
+            batch_kwargs["cancelled"] = counter.budget.cancelled
+        if parallel:
+            result = await run_in_process_pool(config, _check_files, batch_kwargs)
+        else:
+            result = await run_in_executor(config, _check_files, batch_kwargs)
+        await counter.update(len(batch), len(result))
+        return result
+
+    results = await run_batches(batches, check_batch, workers, counter.budget)
+    violations = []
+    checked = []
+    for batch, result in zip(batches, results, strict=True):
+        if result is not None:
+            violations.extend(result)
+            checked.extend(batch)
+    return violations, checked
+
+
+async def _check_until_enough(
+    config: Config,
+    kwargs: dict,
+    files: list[Path],
+    cached: dict[Path, list[Violation]],
+    counter: ProgressCounter,
+) -> tuple[list[Violation], list[Path]]:
+    """Check files in order, chunk by chunk, until the report has enough violations.
+
+    Checked files are always the first files in order, so the rule selected for the report is
+    the same rule as with all files. Files which are not checked are skipped in the budget.
+    """
+    chunk_size = CHECK_BATCH_SIZE
+    if config.parallel:
+        chunk_size *= config.max_workers or os.cpu_count() or 1
+    violations: list[Violation] = []
+    checked: list[Path] = []
+    ordered: list[Violation] = []
+    for start in range(0, len(files), chunk_size):
+        if has_enough_violations(ordered, config, kwargs.get("rules", frozenset())):
+            remaining = [file for file in files[start:] if file not in cached]
+            counter.budget.skip(len(remaining), "enough violations found, violation counts are estimated")
+            break
+        chunk = files[start : start + chunk_size]
+        missing = [file for file in chunk if file not in cached]
+        result, done = await _check_sources(config, kwargs, missing, counter)
+        violations.extend(result)
+        checked.extend(done)
+        found = _group_by_file(result)
+        ordered.extend(violation for file in chunk for violation in cached.get(file, found.get(file, [])))
+    return violations, checked
+
+
+def has_enough_violations(
+    violations: list[Violation], config: Config, rules: frozenset[str] = frozenset()
+) -> bool:
+    """Return True when more files can not change the rule or the violations selected for the report.
+
+    When rules are given, only the violations of the rules are counted and only the rules can be
+    found by checking more files.
+    """
+    if rules:
+        violations = [violation for violation in violations if violation.rule_id in rules]
+    first_violation = _get_first_violation(violations, config)
+    if first_violation is None:
+        return False
+    rule_priority = [rule for rule in config.rule_priority if not rules or rule in rules]
+    if rule_priority:
+        selected = first_violation.rule_id in rule_priority
+    elif rules and rules.issubset(config.rule_ignore):
+        selected = True
+    else:
+        selected = first_violation.rule_id not in config.rule_ignore
+    count = sum(1 for violation in violations if violation.rule_id == first_violation.rule_id)
+    return selected and count >= config.violation_count
+
+
+def get_batch_count(
+    files: list[Path], batch_size: int, counter: ProgressCounter, *, stoppable: bool = False
+) -> int:
+    """Return number of batches, stoppable batches are stopped between files when the call is cancelled."""
+    if stoppable and counter.callback is None and counter.budget.timeout is None:
+        batch_size *= QUIET_BATCH_FACTOR
+    return math.ceil(len(files) / batch_size)
+
+
+def split_into_batches(files: list[Path], batch_count: int) -> list[list[Path]]:
+    if not files:
         return []
-    return _convert_to_violations(result)
+    return [
+        files[index * len(files) // batch_count : (index + 1) * len(files) // batch_count]
+        for index in range(batch_count)
+    ]
+
+
+async def run_batches(
+    batches: list[list[Path]], run: Callable[[list[Path]], Awaitable[T]], workers: int, budget: WorkBudget
+) -> list[T | None]:
+    """Run batches, at most workers batches at the same time. Returns None for the skipped batches.
+
+    Timeout is checked before a batch is started, batches which are running are completed. When
+    the call is cancelled, budget.cancelled is set for the batches which are running.
+    """
+    semaphore = asyncio.Semaphore(workers)
+
+    async def run_batch(batch: list[Path]) -> T | None:
+        async with semaphore:
+            if budget.expired():
+                budget.skip_expired(len(batch))
+                return None
+            return await run(batch)
+
+    try:
+        return list(await asyncio.gather(*(run_batch(batch) for batch in batches)))
+    except asyncio.CancelledError:
+        budget.cancelled.set()
+        raise
+
+
+def _group_by_file(violations: list[Violation]) -> dict[Path, list[Violation]]:
+    grouped: dict[Path, list[Violation]] = {}
+    for violation in violations:
+        grouped.setdefault(violation.file, []).append(violation)
+    return grouped
+
+
+def _merge_violations(files: list[Path], violations: dict[Path, list[Violation]]) -> list[Violation]:
+    """Merge violations in file discovery order, violations inside a file keep the Robocop order."""
+    merged = [violation for file in files for violation in violations.get(file, [])]
+    known_files = set(files)
+    merged.extend(
+        violation for file, items in violations.items() if file not in known_files for violation in items
+    )
+    return merged
+
+
+def get_lint_cache(config: Config) -> FileCache:
+    return FileCache(get_cache_dir(), "lint", config.cache_size)
+
+
+def _dump_violations(violations: list[Violation]) -> str:
+    return json.dumps(
+        [
+            [
+                violation.start_line,
+                violation.end_line,
+                violation.start_column,
+                violation.end_column,
+                violation.severity,
+                violation.rule_id,
+                violation.description,
+            ]
+            for violation in violations
+        ]
+    )
+
+
+def _load_violations(file: Path, value: str) -> list[Violation]:
+    # Line and column numbers are followed by severity, rule id and description.
+    return [
+        Violation(file, *item[:4], *(sys.intern(text) for text in item[4:])) for item in json.loads(value)
+    ]
+
+
+@dataclass
+class _StoredResult:
+    signature: str
+    key: str
+    violations: list[Violation]
+
+
+# Latest results kept in memory, so that unchanged files are not read or hashed again.
+_RESULT_STORE: OrderedDict[Path, _StoredResult] = OrderedDict()
+_RESULT_STORE_LOCK = threading.Lock()
+
+
+def _get_file_signature(file: Path) -> str | None:
+    try:
+        stat = file.stat()
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def clear_result_store() -> None:
+    with _RESULT_STORE_LOCK:
+        _RESULT_STORE.clear()
+
+
+def _get_stored_violations(file: Path, signature: str, key: str | None) -> list[Violation] | None:
+    with _RESULT_STORE_LOCK:
+        stored = _RESULT_STORE.get(file)
+        if stored is None:
+            return None
+        if stored.signature == signature or stored.key == key:
+            stored.signature = signature
+            _RESULT_STORE.move_to_end(file)
+            return stored.violations
+    return None
+
+
+def _store_violations(config: Config, file: Path, key: str, violations: list[Violation]) -> None:
+    file_signature = _get_file_signature(file)
+    if file_signature is None:
+        return
+    # Key is content hash followed by the configuration part, which is also part of the signature.
+    signature = f"{file_signature}:{key.partition(':')[2]}"
+    with _RESULT_STORE_LOCK:
+        _RESULT_STORE[file] = _StoredResult(signature, key, violations)
+        _RESULT_STORE.move_to_end(file)
+        while len(_RESULT_STORE) > config.cache_size:
+            _RESULT_STORE.popitem(last=False)
+
+
+def _get_cached_violations(
+    config: Config, files: dict[Path, str]
+) -> tuple[dict[Path, list[Violation]], dict[Path, str]]:
+    """Return cached violations and cache keys for the files, files which can not be read have no key.
+
+    Results are searched first from memory, where file modification time and size are enough
+    to detect unchanged file, and then from the disk cache by the file content hash.
+    """
+    cached: dict[Path, list[Violation]] = {}
+    keys: dict[Path, str] = {}
+    for file, config_hash in files.items():
+        config_key = f"{config_hash}:{config.fingerprint}"
+        file_signature = _get_file_signature(file)
+        if file_signature is None:
+            continue
+        signature = f"{file_signature}:{config_key}"
+        stored = _get_stored_violations(file, signature, None)
+        if stored is not None:
+            cached[file] = stored
+            continue
+        content_hash = hash_file(file)
+        if content_hash is None:
+            continue
+        keys[file] = f"{content_hash}:{config_key}"
+        stored = _get_stored_violations(file, signature, keys[file])
+        if stored is not None:
+            cached[file] = stored
+    found = get_lint_cache(config).get({file: key for file, key in keys.items() if file not in cached})
+    for file, value in found.items():
+        cached[file] = _load_violations(file, value)
+        _store_violations(config, file, keys[file], cached[file])
+    return cached, keys
+
+
+def _set_cached_violations(
+    config: Config, keys: dict[Path, str], checked: dict[Path, list[Violation]]
+) -> None:
+    # Files which are checked without violations are cached with empty list.
+    values = {file: (key, _dump_violations(checked.get(file, []))) for file, key in keys.items()}
+    get_lint_cache(config).set(values)
+    for file, key in keys.items():
+        _store_violations(config, file, key, checked.get(file, []))
+
+
+def get_call_key(
+    tool: str, path: str | Path, config: Config, git_ref: str | None, rules: tuple[str, ...] = ()
+) -> tuple[str, str, str, str | None, tuple[str, ...]]:
+    """Return key which identifies identical concurrent calls of the tool."""
+    return (tool, str(Path(path).resolve()), config.fingerprint, git_ref, rules)
+
+
+def discover_files(
+    sources: list[Path], configuration_file: Path | None = None, *, root: Path | None = None
+) -> dict[Path, str]:
+    """Find Robot Framework files from sources, by using Robocop file filters.
+
+    Returns files mapped to the hash of the Robocop configuration used for the file. With root,
+    file filters are applied also to the files given in sources and to their folders below root,
+    like the files would have been found by walking from root.
+    """
+    config_manager = ConfigManager(sources=sources, config=configuration_file, force_exclude=root is not None)
+    return {
+        source_file.path: source_file.config.hash
+        for source_file in config_manager.paths
+        if root is None or not _in_excluded_folder(source_file, root)
+    }
+
+
+def _in_excluded_folder(source_file: SourceFile, root: Path) -> bool:
+    if not source_file.path.is_relative_to(root):
+        return False
+    folders = source_file.path.relative_to(root).parents
+    return any(source_file.config.file_filters.path_excluded(folder) for folder in folders)
+
+
+def expand_paths(paths: list[str]) -> tuple[list[Path], list[str]]:
+    """Expand glob patterns in paths, relative paths are relative to the current directory.
+
+    Returns existing paths, without duplicates, and the paths or patterns which did not match anything.
+    """
+    sources: dict[Path, None] = {}
+    missing: list[str] = []
+    for path in paths:
+        if GLOB_CHARACTERS.intersection(path):
+            pattern = Path(path)
+            root = Path(pattern.anchor) if pattern.is_absolute() else Path()
+            matches = sorted(root.glob(str(pattern.relative_to(root))))
+        else:
+            matches = [Path(path)] if Path(path).exists() else []
+        if not matches:
+            missing.append(path)
+        sources.update(dict.fromkeys(match.resolve() for match in matches))
+    return list(sources), missing
+
+
+def discover_changed_files(path: Path, git_ref: str, kwargs: dict[str, Any]) -> dict[Path, str]:
+    """Find files in path which are changed compared to the git ref, or are staged or untracked."""
+    changed = get_changed_files(path, git_ref)
+    if not changed:
+        return {}
+    return discover_files(changed, kwargs.get("configuration_file"), root=path.resolve())
+
+
+def _get_file_size(file: Path) -> int:
+    try:
+        return file.stat().st_size
+    except OSError:
+        return 0
+
+
+def split_into_shards(files: list[Path], count: int) -> list[list[Path]]:
+    """Split files to shards with roughly equal total file size."""
+    sizes = {file: _get_file_size(file) for file in files}
+    shards: list[list[Path]] = [[] for _ in range(max(count, 1))]
+    heap = [(0, index) for index in range(len(shards))]
+    for file in sorted(files, key=sizes.__getitem__, reverse=True):
+        size, index = heapq.heappop(heap)
+        shards[index].append(file)
+        heapq.heappush(heap, (size + sizes[file], index))
+    return [shard for shard in shards if shard]
+
+
+def lint_files(
+    sources: list[Path],
+    fingerprint: str,
+    configuration_file: Path | None = None,
+    rules: frozenset[str] = frozenset(),
+    cancelled: threading.Event | None = None,
+) -> list[Diagnostic]:
+    """Check files with the cached linter, which reuses the resolved Robocop configuration and rules."""
+    return get_linter(configuration_file, fingerprint).check_files(sources, rules, cancelled)
+
+
+def _check_files(kwargs: dict) -> list[Violation]:
+    return convert_to_violations(lint_files(**kwargs))
 
 
 def _get_first_violation(violations: list[Violation], config: Config) -> Violation | None:
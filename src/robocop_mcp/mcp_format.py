@@ -14,41 +14,239 @@
 # NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
 # DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import asyncio
+import functools
+import os
+import re
 import sys
+import threading
+from collections.abc import Iterable
+from contextvars import ContextVar
 from io import StringIO
 from pathlib import Path
+from typing import Any, TextIO
 
 import typer
+from robocop.exceptions import FatalError  # type: ignore
 from robocop.run import format_files  # type: ignore
 from typing_extensions import Self
 
-from .config import get_config, logger, set_robocop_config_file
+from .config import Config, get_cache_dir, get_config, logger, set_robocop_config_file
+from .executor import run_in_executor, run_in_process_pool, run_single_flight
+from .file_cache import FileCache, hash_file
+from .mcp_check import (
+    ProgressCallback,
+    ProgressCounter,
+    WorkBudget,
+    discover_changed_files,
+    discover_files,
+    get_batch_count,
+    get_call_key,
+    run_batches,
+    split_into_batches,
+    split_into_shards,
+)
+
+# Files formatted in one Robocop call when progress is reported or timeout is set.
+FORMAT_BATCH_SIZE = 50
+_SUMMARY = re.compile(
+    r"^(?P<changed>\d+) files?(?P<tense> would be)? reformatted, "
+    r"(?P<unchanged>\d+) files?(?: would be)? left unchanged\."
+    r"(?: (?P<skipped>\d+) files?(?: would be)? skipped\.)?$"
+)
+
+
+# Output of the current context is written here, when it is captured.
+_CAPTURED_OUTPUT: ContextVar[tuple[StringIO, StringIO] | None] = ContextVar("captured_output", default=None)
+_INSTALL_LOCK = threading.Lock()
+
+
+class _ContextStream:
+    """Stream which writes to the output captured in the current context, or to the wrapped stream."""
+
+    def __init__(self, stream: TextIO, index: int) -> None:
+        self._stream = stream
+        self._index = index
+
+    def _target(self) -> TextIO:
+        output = _CAPTURED_OUTPUT.get()
+        return output[self._index] if output is not None else self._stream
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def writelines(self, lines: Iterable[str]) -> None:
+        self._target().writelines(lines)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._stream, name)
+
+
+def _install_context_streams() -> None:
+    with _INSTALL_LOCK:
+        if not isinstance(sys.stdout, _ContextStream):
+            sys.stdout = _ContextStream(sys.stdout, 0)
+        if not isinstance(sys.stderr, _ContextStream):
+            sys.stderr = _ContextStream(sys.stderr, 1)
 
 
 class Capturing(list):
+    """Capture stdout and stderr written in the current thread or task.
+
+    Output from other threads and tasks is not captured, so concurrent calls do not mix
+    their output.
+    """
+
     def __enter__(self) -> Self:
-        self._stdout = sys.stdout
-        self._stderr = sys.stderr
-        sys.stdout = self._stringio_out = StringIO()
-        sys.stderr = self._stringio_err = StringIO()
+        _install_context_streams()
+        self._output = (StringIO(), StringIO())
+        self._token = _CAPTURED_OUTPUT.set(self._output)
         return self
 
     def __exit__(self, *_: object) -> None:
-        stdout_content = self._stringio_out.getvalue()
-        stderr_content = self._stringio_err.getvalue()
-        self.extend(stdout_content.splitlines())
-        self.extend(stderr_content.splitlines())
-        del self._stringio_out
-        del self._stringio_err
-        sys.stdout = self._stdout
-        sys.stderr = self._stderr
-
-
-async def robocop_format(path: Path) -> str:
-    sources = [path]
+        _CAPTURED_OUTPUT.reset(self._token)
+        for output in self._output:
+            self.extend(output.getvalue().splitlines())
+        del self._output
+
+
+async def robocop_format(
+    path: Path, progress: ProgressCallback | None = None, git_ref: str | None = None
+) -> str:
+    """Format files in path, when git_ref is given only files changed compared to the ref are formatted.
+
+    Concurrent calls with the same path, configuration and git_ref share one format run, so
+    that files are not written by two runs at the same time.
+    """
     config = get_config()
-    kwargs = {"sources": sources, "reruns": config.robocop_reruns}
+    key = get_call_key("format", path, config, git_ref)
+    return await run_single_flight(key, functools.partial(_robocop_format, config, path, progress, git_ref))
+
+
+async def _robocop_format(
+    config: Config, path: Path, progress: ProgressCallback | None, git_ref: str | None
+) -> str:
+    kwargs: dict[str, Any] = {"sources": [path], "reruns": config.robocop_reruns}
     kwargs = set_robocop_config_file(config, kwargs)
+    budget = WorkBudget.from_config(config)
+    files: dict[Path, str] = {}
+    if git_ref is not None:
+        files = await asyncio.to_thread(discover_changed_files, path, git_ref, kwargs)
+        if not files:
+            return f"No changed files compared to {git_ref}."
+    elif config.cache or config.parallel or progress is not None or budget.limited:
+        files = await asyncio.to_thread(_discover_format_files, path, kwargs.get("configuration_file"))
+    if files:
+        files = {file: files[file] for file in budget.limit(list(files))}
+    clean: set[Path] = set()
+    keys: dict[Path, str] = {}
+    if config.cache and files:
+        clean, keys = await asyncio.to_thread(_get_clean_files, config, files)
+        logger.info("Skipping %s of %s files formatted earlier", len(clean), len(files))
+    missing = [file for file in files if file not in clean] if files else [path]
+    counter = ProgressCounter(progress, len(files) or 1, budget=budget)
+    if clean:
+        await counter.update(len(clean), 0)
+    reports = await _format_in_batches(config, kwargs, missing, keys, counter)
+    report_lines = [reports[0] if len(reports) == 1 else _merge_reports(reports)] if reports else []
+    if clean:
+        report_lines.append(
+            f"{len(clean)} file{'' if len(clean) == 1 else 's'} skipped, not changed since last format."
+        )
+    note = budget.note("formatted")
+    if note:
+        logger.warning(note)
+        report_lines.append(note)
+    report = "\n".join(report_lines)
+    logger.info("RoboCop format completed with report: %s", report)
+    return report
+
+
+async def _format_in_batches(
+    config: Config, kwargs: dict, files: list[Path], keys: dict[Path, str], counter: ProgressCounter
+) -> list[str]:
+    """Format files in batches, or in parallel shards in the process pool when parallel is enabled.
+
+    Batch which has started is completed, cancel and timeout stop formatting before the next batch.
+    """
+    batch_count = get_batch_count(files, FORMAT_BATCH_SIZE, counter)
+    parallel = config.parallel and len(files) > 1
+    if parallel:
+        workers = config.max_workers or os.cpu_count() or 1
+        batches = split_into_shards(files, max(workers, batch_count))
+        logger.info("Formatting %s files in %s shards", len(files), len(batches))
+    else:
+        workers = 1
+        batches = split_into_batches(files, batch_count)
+
+    async def format_batch(batch: list[Path]) -> str:
+        batch_kwargs = {**kwargs, "sources": batch}
+        if parallel:
+            report = await run_in_process_pool(config, _format_sources, batch_kwargs)
+        else:
+            report = await run_in_executor(config, _format_sources, batch_kwargs)
+        if config.cache:
+            batch_keys = {file: keys[file] for file in batch if file in keys}
+            await asyncio.to_thread(_set_clean_files, config, batch_keys, report)
+        await counter.update(len(batch), 0)
+        return report
+
+    reports = await run_batches(batches, format_batch, workers, counter.budget)
+    return [report for report in reports if report is not None]
+
+
+def get_format_cache(config: Config) -> FileCache:
+    return FileCache(get_cache_dir(), "format", config.cache_size)
+
+
+def _discover_format_files(path: Path, configuration_file: Path | None) -> dict[Path, str]:
+    """Return files to format with their Robocop configuration hash, given file keeps its path as it is.
+
+    When files can not be resolved, empty dict is returned and the formatter reports the error.
+    """
+    try:
+        files = discover_files([path], configuration_file)
+    except FatalError as error:
+        logger.info("Could not resolve files to format: %s", error)
+        return {}
+    if not path.is_dir() and len(files) == 1:
+        return {path: next(iter(files.values()))}
+    return files
+
+
+def _get_clean_files(config: Config, files: dict[Path, str]) -> tuple[set[Path], dict[Path, str]]:
+    """Return files which are not changed since the last format and cache keys for all files."""
+    keys = {}
+    for file, config_hash in files.items():
+        content_hash = hash_file(file)
+        if content_hash is not None:
+            keys[file] = f"{content_hash}:{config_hash}:{config.fingerprint}"
+    return set(get_format_cache(config).get(keys)), keys
+
+
+def _set_clean_files(config: Config, keys: dict[Path, str], report: str) -> None:
+    """Store formatted files as clean, unless formatting failed or files were not written."""
+    if report.startswith("Error during formatting:"):
+        return
+    not_clean = {
+        line.split(" ", 2)[-1]
+        for line in report.splitlines()
+        if line.startswith(("Would reformat ", "Failed to decode "))
+    }
+    values = {}
+    for file, key in keys.items():
+        content_hash = hash_file(file)
+        if content_hash is None or any(str(file) in line for line in not_clean):
+            continue
+        # File content is changed by the formatter, so key is built from the new content.
+        values[file] = (f"{content_hash}:{key.partition(':')[2]}", "clean")
+    get_format_cache(config).set(values)
+
+
+def _format_sources(kwargs: dict) -> str:
     raised_error = None
     with Capturing() as output:
         try:
@@ -58,6 +256,29 @@ async def robocop_format(path: Path) -> str:
         except Exception as error:  # noqa
             logger.error("Error during RoboCop format: %s", error)
             raised_error = error
-    report = "\n".join(output) if not raised_error else f"Error during formatting: {raised_error}"
-    logger.info("RoboCop format completed with report: %s", report)
-    return report
+    return "\n".join(output) if not raised_error else f"Error during formatting: {raised_error}"
+
+
+def _merge_reports(reports: list[str]) -> str:
+    """Merge reports of formatted batches, summary lines are combined to one summary."""
+    lines = []
+    changed = unchanged = skipped = 0
+    tense = ""
+    for report in reports:
+        for line in report.splitlines():
+            match = _SUMMARY.match(line)
+            if match is None:
+                if line:
+                    lines.append(line)
+                continue
+            changed += int(match["changed"])
+            unchanged += int(match["unchanged"])
+            skipped += int(match["skipped"] or 0)
+            tense = match["tense"] or ""
+    summary = (
+        f"{changed} file{'' if changed == 1 else 's'}{tense} reformatted, "
+        f"{unchanged} file{'' if unchanged == 1 else 's'}{tense} left unchanged."
+    )
+    if skipped:
+        summary += f" {skipped} file{'' if skipped == 1 else 's'}{tense} skipped."
+    return "\n".join([*lines, "", summary])
@@ -0,0 +1,117 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import Config, logger
+from .mcp_check import Violation, format_report, get_violation_fix
+from .results import LintResult, count_rules, encode_cursor
+
+
+@dataclass
+class RuleViolations:
+    rule_id: str
+    severity: str
+    violations: list[Violation]
+
+
+@dataclass
+class FileViolations:
+    file: Path
+    rules: list[RuleViolations]
+
+
+def group_violations(violations: list[Violation]) -> list[FileViolations]:
+    """Group violations by file and then by rule, in the order files and rules are first seen."""
+    files: dict[Path, dict[str, RuleViolations]] = {}
+    for violation in violations:
+        rules = files.setdefault(violation.file, {})
+        rule = rules.setdefault(violation.rule_id, RuleViolations(violation.rule_id, violation.severity, []))
+        rule.violations.append(violation)
+    return [FileViolations(file, list(rules.values())) for file, rules in files.items()]
+
+
+def render_markdown(result: LintResult, page: list[Violation], offset: int, config: Config) -> str:
+    logger.info("Dump to markdown...")
+    markdown_lines = ["# Robocop Report", ""]
+    for file in group_violations(page):
+        for rule in file.rules:
+            for violation in rule.violations:
+                markdown_lines.extend(format_report(violation))
+
+    first_violation = page[0]
+    proposed_fix = get_violation_fix(first_violation, config)
+    markdown_lines.extend(
+        [
+            "",
+            "## Proposed fixe for violations",
+            "",
+            f"The following fix is proposed: {proposed_fix}",
+        ],
+    )
+    report = result.violations
+    if len(page) < len(report):
+        markdown_lines.append(f"\nand {len(report) - len(page)} more violations not shown.")
+    else:
+        markdown_lines.append("\nAll violations reported.")
+    rules = count_rules(report, config.rule_ignore)
+    markdown_lines.extend(["", "## Paging", "", f"result id: {result.result_id}"])
+    next_offset = offset + len(page)
+    if next_offset < rules.get(first_violation.rule_id, next_offset):
+        markdown_lines.append(f"next cursor: {encode_cursor(first_violation.rule_id, next_offset)}")
+    rule_counts = ", ".join(f"{rule_id} ({count})" for rule_id, count in rules.items())
+    markdown_lines.append(f"rules with violations: {rule_counts}")
+    if result.note:
+        markdown_lines.extend(["", "## Partial result", "", result.note])
+    return "\n".join(markdown_lines)
+
+
+def render_json(result: LintResult, config: Config) -> str:
+    """Render violations, without the ignored rules, as compact JSON.
+
+    Violation is a list of start line, start column, end line, end column and description,
+    severity is the first letter of the severity name.
+    """
+    violations = [violation for violation in result.violations if violation.rule_id not in config.rule_ignore]
+    files = [
+        {
+            "f": str(file.file),
+            "r": [
+                {
+                    "id": rule.rule_id,
+                    "s": rule.severity[:1],
+                    "v": [
+                        [
+                            violation.start_line,
+                            violation.start_column,
+                            violation.end_line,
+                            violation.end_column,
+                            violation.description,
+                        ]
+                        for violation in rule.violations
+                    ],
+                }
+                for rule in file.rules
+            ],
+        }
+        for file in group_violations(violations)
+    ]
+    report: dict[str, object] = {"id": result.result_id, "n": len(violations), "files": files}
+    if result.note:
+        report["note"] = result.note
+    return json.dumps(report, ensure_ascii=False, separators=(",", ":"))
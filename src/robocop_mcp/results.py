@@ -0,0 +1,87 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .mcp_check import Violation
+
+# Number of lint results kept for paging, oldest results are removed first.
+MAX_STORED_RESULTS = 20
+
+
+@dataclass
+class LintResult:
+    result_id: str
+    path: str
+    violations: list[Violation]
+    note: str = ""
+
+
+_RESULTS: OrderedDict[str, LintResult] = OrderedDict()
+_RESULTS_LOCK = threading.Lock()
+_RESULT_IDS = itertools.count(1)
+
+
+def store_result(path: str, violations: list[Violation], note: str = "") -> LintResult:
+    with _RESULTS_LOCK:
+        result = LintResult(f"r{next(_RESULT_IDS)}", path, violations, note)
+        _RESULTS[result.result_id] = result
+        while len(_RESULTS) > MAX_STORED_RESULTS:
+            _RESULTS.popitem(last=False)
+    return result
+
+
+def get_result(result_id: str) -> LintResult | None:
+    with _RESULTS_LOCK:
+        result = _RESULTS.get(result_id.strip())
+        if result is not None:
+            _RESULTS.move_to_end(result.result_id)
+        return result
+
+
+def clear_results() -> None:
+    global _RESULT_IDS  # noqa: PLW0603
+    with _RESULTS_LOCK:
+        _RESULTS.clear()
+        _RESULT_IDS = itertools.count(1)
+
+
+def encode_cursor(rule_id: str, offset: int) -> str:
+    return f"{rule_id}:{offset}"
+
+
+def decode_cursor(cursor: str) -> tuple[str, int] | None:
+    rule_id, _, offset = cursor.strip().rpartition(":")
+    if not rule_id or not offset.isdigit():
+        return None
+    return rule_id, int(offset)
+
+
+def count_rules(violations: list[Violation], ignore: list[str]) -> dict[str, int]:
+    """Count violations per rule in the order rules are first seen, ignored rules are left out."""
+    counts: dict[str, int] = {}
+    for violation in violations:
+        if violation.rule_id not in ignore:
+            counts[violation.rule_id] = counts.get(violation.rule_id, 0) + 1
+    return counts
+
+
+def get_page(violations: list[Violation], rule_id: str, offset: int, count: int) -> list[Violation]:
+    rule_violations = [violation for violation in violations if violation.rule_id == rule_id]
+    return rule_violations[offset : offset + count]
@@ -15,31 +15,91 @@
 # DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import threading
 from pathlib import Path
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 
-from .config import get_config, logger, resolve_path
-from .mcp_check import filter_violations, format_report, get_violation_fix, run_robocop
+from .config import get_config, get_rule_id_by_name_or_id, logger, resolve_path
+from .executor import shutdown_executors, start_process_pool
+from .git_changes import GitError
+from .mcp_buffer import diff_text, format_text, lint_text, resolve_buffer_path
+from .mcp_check import (
+    CheckResult,
+    ProgressCallback,
+    Violation,
+    check_files_to_cache,
+    expand_paths,
+    filter_violations,
+    run_robocop,
+    run_robocop_batch,
+)
 from .mcp_format import robocop_format
+from .report import render_json, render_markdown
+from .results import decode_cursor, get_page, get_result, store_result
+from .watch import Watcher
 
 mcp = FastMCP("op-robocop-mcp")
+_WATCHERS: list[Watcher] = []
+
+
+def _progress_requested(ctx: Context | None) -> bool:
+    """FastMCP gives context to every tool call, progress is sent only when the client asks for it."""
+    if ctx is None:
+        return False
+    try:
+        meta = ctx.request_context.meta
+    except ValueError:
+        return False
+    return meta is not None and meta.progressToken is not None
+
+
+def _check_progress(ctx: Context | None) -> ProgressCallback | None:
+    if ctx is None or not _progress_requested(ctx):
+        return None
+
+    async def report(done: int, total: int, violations: int) -> None:
+        await ctx.report_progress(done, total, f"Checked {done}/{total} files, found {violations} violations")
+
+    return report
+
+
+def _format_progress(ctx: Context | None) -> ProgressCallback | None:
+    if ctx is None or not _progress_requested(ctx):
+        return None
+
+    async def report(done: int, total: int, _: int) -> None:
+        await ctx.report_progress(done, total, f"Formatted {done}/{total} files")
+
+    return report
 
 
 @mcp.tool()
-async def get_robocop_report(path: str | None) -> str:
+async def get_robocop_report(
+    path: str | None, ctx: Context | None = None, git_ref: str | None = None, rule_id: str | None = None
+) -> str:
     """
     Run RoboCop on the provided source code and return the report.
 
     Args:
         path (str | None): The path to folder or a file to analyze. If None, uses the
         current directory for analysis.
+        ctx (Context | None): MCP context, used to report progress of the check.
+        git_ref (str | None): If given, only files in the path which differ from the git ref,
+        example HEAD or origin/main, or which are staged or untracked are analyzed.
+        rule_id (str | None): If given, only this rule is checked, rule can be given by id, example
+        DOC02, or by name, example missing-doc-test-case.
 
     Returns:
         str: The Robocop report in markdown format. Report by default contains 20 first violations
         of the same type. If there are other types of violations or there are more than 20 same type
         of violations, a note is added about how many more violations were found but not shown.
         Report contains at the end also a proposed fix for the first violation.
+        If max_files or timeout limit is reached, report ends with a partial result note.
+        Files are checked in batches of 50 files, or 500 files when progress is not requested and
+        timeout is not set. When timeout is reached, no new batch is started. When the call is
+        cancelled, also the running batch stops between files, except in the process pool.
 
     Example if there is one Violation in path, which looks like this:
     Violation(
@@ -74,56 +134,231 @@ async def get_robocop_report(path: str | None) -> str:
     """
     path_resolved = resolve_path(path)
     logger.info("Running Robocop check on path: '%s'", path_resolved)
-    report = await run_robocop(path_resolved)
+    try:
+        report = await _check_rules(path_resolved, _check_progress(ctx), git_ref, rule_id)
+    except GitError as error:
+        logger.error("Could not get changed files: %s", error)
+        return f"# Robocop Report\n\nCould not get changed files: {error}"
+    return _markdown_report(path_resolved, report, report.note)
+
+
+async def _check_rules(
+    path: str, progress: ProgressCallback | None, git_ref: str | None, rule_id: str | None
+) -> CheckResult:
+    config = get_config()
+    if rule_id:
+        rule = get_rule_id_by_name_or_id(rule_id) or rule_id.upper()
+        logger.info("Checking only rule %s", rule)
+        return await run_robocop(path, progress, git_ref, rules=(rule,), stop_early=config.early_exit)
+    priority = tuple(rule for rule in config.rule_priority if rule not in config.rule_ignore)
+    if config.priority_rules_first and priority:
+        report = await run_robocop(path, progress, git_ref, rules=priority, stop_early=config.early_exit)
+        if report:
+            rules = ", ".join(priority)
+            return _add_note(
+                report, f"Only rule_priority rules {rules} were checked, other rules were not checked."
+            )
+        logger.info("No violations for priority rules, checking all rules")
+    return await run_robocop(path, progress, git_ref, stop_early=config.early_exit)
+
+
+def _add_note(report: CheckResult, note: str) -> CheckResult:
+    # Result can be shared with concurrent calls, so the note is added to a copy.
+    result = CheckResult(report)
+    result.note = " ".join(part for part in (note, report.note) if part)
+    return result
+
+
+def _markdown_report(path: str, report: list[Violation], note: str = "") -> str:
     filter_report = filter_violations(report)
     if not filter_report:
         logger.info("No violations found.")
-        return "# Robocop Report\n\nNo violations found."
-    logger.info("Dump to markdown...")
-    markdown_lines = ["# Robocop Report", ""]
-    for item in filter_report:
-        markdown_lines.extend(format_report(item))
+        partial = f"\n\n## Partial result\n\n{note}" if note else ""
+        return f"# Robocop Report\n\nNo violations found.{partial}"
+    result = store_result(path, report, note)
+    return render_markdown(result, filter_report, 0, get_config())
 
-    first_violation = filter_report[0]
-    config = get_config()
-    proposed_fix = get_violation_fix(first_violation, config)
-    markdown_lines.extend(
-        [
-            "",
-            "## Proposed fixe for violations",
-            "",
-            f"The following fix is proposed: {proposed_fix}",
-        ],
-    )
-    if len(filter_report) < len(report):
-        markdown_lines.append(f"\nand {len(report) - len(filter_report)} more violations not shown.")
+
+@mcp.tool()
+async def get_robocop_buffer_report(text: str, file_name: str | None = None) -> str:
+    """
+    Run RoboCop on Robot Framework source text, which does not need to be saved to a file.
+
+    Args:
+        text (str): The Robot Framework source code to analyze.
+        file_name (str | None): Name or path of the file where the text belongs, example
+        tests/login.robot. The name decides the file type and the Robocop configuration used.
+        The file does not need to exist. If None, buffer.robot in the current directory is used.
+
+    Returns:
+        str: The Robocop report in markdown format, in the same format as get_robocop_report
+        returns it.
+    """
+    logger.info("Running Robocop check on source text of: '%s'", file_name)
+    report = await asyncio.to_thread(lint_text, text, file_name)
+    return _markdown_report(str(resolve_buffer_path(file_name)), report)
+
+
+@mcp.tool()
+async def get_robocop_report_json(path: str | None, ctx: Context | None = None) -> str:
+    """
+    Run RoboCop on the provided source code and return all violations as compact JSON.
+
+    Args:
+        path (str | None): The path to folder or a file to analyze. If None, uses the
+        current directory for analysis.
+        ctx (Context | None): MCP context, used to report progress of the check.
+
+    Returns:
+        str: JSON object with keys: "id" result id, which can be used with get_robocop_report_page,
+        "n" number of violations and "files" list of files. Each file has "f" file path and "r" list
+        of rules. Each rule has "id" rule id, "s" severity (E, W or I) and "v" list of violations.
+        Each violation is a list of start line, start column, end line, end column and description.
+        Violations of ignored rules are not included.
+        If max_files or timeout limit is reached, "note" tells how many files were not checked.
+
+    Example:
+    {"id":"r1","n":1,"files":[{"f":"/path/to/sample.robot","r":[{"id":"DOC02","s":"W",
+    "v":[[2,1,2,15,"Missing documentation in 'this is a test' test case"]]}]}]}
+    """
+    path_resolved = resolve_path(path)
+    logger.info("Running Robocop check on path: '%s'", path_resolved)
+    report = await run_robocop(path_resolved, _check_progress(ctx))
+    result = store_result(path_resolved, report, report.note)
+    return render_json(result, get_config())
+
+
+@mcp.tool()
+async def get_robocop_batch_report(paths: list[str], ctx: Context | None = None) -> str:
+    """
+    Run RoboCop on many files and folders in one call and return all violations as compact JSON.
+
+    Args:
+        paths (list[str]): Paths to files or folders, or glob patterns, example tests/login.robot
+        or tests/**/*.resource. Relative paths are relative to the current directory.
+        ctx (Context | None): MCP context, used to report progress of the check.
+
+    Returns:
+        str: JSON object in the same format as get_robocop_report_json returns it, violations are
+        grouped by file path. If some paths did not match any files, or max_files or timeout limit
+        is reached, "note" tells about it.
+    """
+    logger.info("Running Robocop check on paths: %s", paths)
+    sources, missing = await asyncio.to_thread(expand_paths, paths)
+    report = await run_robocop_batch(sources, _check_progress(ctx)) if sources else CheckResult()
+    notes = [f"No files found for: {', '.join(missing)}."] if missing else []
+    if report.note:
+        notes.append(report.note)
+    result = store_result(", ".join(paths), report, " ".join(notes))
+    return render_json(result, get_config())
+
+
+@mcp.tool()
+async def get_robocop_report_page(
+    result_id: str, cursor: str | None = None, rule_id: str | None = None
+) -> str:
+    """
+    Return a page of violations from a report created by get_robocop_report, without running RoboCop again.
+
+    Args:
+        result_id (str): The result id from the report.
+        cursor (str | None): The next cursor from the report, returns the next page of violations
+        for the same rule.
+        rule_id (str | None): Rule id or name, returns the first page of violations for the rule.
+        Used when cursor is not given.
+
+    Returns:
+        str: The Robocop report in markdown format, in the same format as get_robocop_report
+        returns it.
+    """
+    result = get_result(result_id)
+    if result is None:
+        return f"# Robocop Report\n\nResult {result_id} not found, run get_robocop_report again."
+    if cursor:
+        position = decode_cursor(cursor)
+        if position is None:
+            return f"# Robocop Report\n\nInvalid cursor: {cursor}"
+        page_rule_id, offset = position
+    elif rule_id:
+        page_rule_id, offset = get_rule_id_by_name_or_id(rule_id) or rule_id.upper(), 0
     else:
-        markdown_lines.append("\nAll violations reported.")
-    return "\n".join(markdown_lines)
+        return "# Robocop Report\n\nGive either cursor or rule_id."
+    config = get_config()
+    page = get_page(result.violations, page_rule_id, offset, config.violation_count)
+    if not page:
+        return f"# Robocop Report\n\nNo violations for rule {page_rule_id} in result {result.result_id}."
+    return render_markdown(result, page, offset, config)
 
 
 @mcp.tool()
-async def run_robocop_format(path: str | None) -> str:
+async def run_robocop_format(path: str | None, ctx: Context | None = None, git_ref: str | None = None) -> str:
     """Runs RoboCop formatter on the given path or folder.
 
     Args:
         path (str | None): The path to folder or a file to format. If None, uses the
         current directory for analysis.
+        ctx (Context | None): MCP context, used to report progress of the formatting.
+        git_ref (str | None): If given, only files in the path which differ from the git ref,
+        example HEAD or origin/main, or which are staged or untracked are formatted.
     Returns:
-        str: A summary of the operation.
+        str: A summary of the operation. Files are formatted in batches, when the call is cancelled
+        or timeout is reached, the batch which is running is completed and no new batch is started.
     """
     path_resolved = resolve_path(path)
     logger.info("Running Robocop format on path: '%s'", path_resolved)
-    return await robocop_format(Path(path_resolved))
+    try:
+        return await robocop_format(Path(path_resolved), _format_progress(ctx), git_ref)
+    except GitError as error:
+        logger.error("Could not get changed files: %s", error)
+        return f"Error during formatting: could not get changed files: {error}"
 
 
-def main() -> None:
-    "Main to run the robocop-mcp server."
-    logger.info("Starting OP Robocop MCP...")
+@mcp.tool()
+async def run_robocop_format_buffer(text: str, file_name: str | None = None, *, diff: bool = False) -> str:
+    """Runs RoboCop formatter on Robot Framework source text in memory, files are not changed.
+
+    Args:
+        text (str): The Robot Framework source code to format.
+        file_name (str | None): Name or path of the file where the text belongs. The name decides
+        the file type and the Robocop configuration used. The file does not need to exist.
+        diff (bool): If True, returns unified diff between the text and the formatted text,
+        instead of the formatted text.
+    Returns:
+        str: The formatted text or the diff. Diff is empty if formatting does not change the text.
+    """
+    logger.info("Running Robocop format on source text of: '%s'", file_name)
+    try:
+        formatted = await asyncio.to_thread(format_text, text, file_name)
+    except Exception as error:  # noqa: BLE001
+        logger.error("Error during RoboCop format: %s", error)
+        return f"Error during formatting: {error}"
+    return diff_text(text, formatted, file_name) if diff else formatted
+
+
+def _warm_up() -> None:
     config = get_config()
     if config.robocopmcp_config_file:
         logger.info("With %s file.", config.robocopmcp_config_file)
-    mcp.run(transport="stdio")
+    if config.executor == "process" or config.parallel:
+        start_process_pool(config)
+    if config.watch and config.watch_path:
+        watcher = Watcher(config.watch_path, config.watch_debounce / 1000, check_files_to_cache)
+        watcher.start()
+        _WATCHERS.append(watcher)
+        check_files_to_cache([config.watch_path])
+
+
+def main() -> None:
+    "Main to run the robocop-mcp server."
+    logger.info("Starting OP Robocop MCP...")
+    # Rule catalog is loaded in the background, so that MCP handshake is not blocked by it.
+    threading.Thread(target=_warm_up, name="robocop-mcp-warm-up", daemon=True).start()
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        for watcher in _WATCHERS:
+            watcher.stop()
+        shutdown_executors()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+# Copyright (c) 2025 Tatu Aalto
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software
+# and associated documentation files (the "Software"), to deal in the Software without restriction,
+# including without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING
+# BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM,
+# DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from .config import logger
+
+try:
+    import watchfiles  # type: ignore
+except ImportError:  # pragma: no cover
+    watchfiles = None  # type: ignore[assignment]
+
+WATCHED_SUFFIXES = (".robot", ".resource")
+POLL_INTERVAL = 1.0
+
+
+FileSnapshot = dict[Path, tuple[int, int]]
+
+
+def find_watched_files(path: Path) -> list[Path]:
+    return sorted(file for file in path.rglob("*") if file.suffix in WATCHED_SUFFIXES)
+
+
+def _take_snapshot(path: Path) -> FileSnapshot:
+    snapshot: FileSnapshot = {}
+    for file in find_watched_files(path):
+        try:
+            stat = file.stat()
+        except OSError:
+            continue
+        snapshot[file] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _changed_files(old: FileSnapshot, new: FileSnapshot) -> set[Path]:
+    changed = {file for file, signature in new.items() if old.get(file) != signature}
+    changed.update(file for file in old if file not in new)
+    return changed
+
+
+class Watcher:
+    """
+    Watch Robot Framework files in the path and call on_change with the changed files.
+
+    File system events are received with watchfiles (inotify in Linux) when it is
+    installed, otherwise files are polled. Changes are debounced, so that a burst of
+    changes, example when a whole folder is formatted, is reported as one batch.
+    """
+
+    def __init__(self, path: Path, debounce: float, on_change: Callable[[list[Path]], None]) -> None:
+        self.path = path
+        self.debounce = debounce
+        self.on_change = on_change
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._snapshot: FileSnapshot = {}
+
+    def start(self) -> None:
+        if watchfiles is None:
+            # Changes made after start returns must be seen by the polling thread.
+            self._snapshot = _take_snapshot(self.path)
+        self._thread = threading.Thread(target=self._run, name="robocop-mcp-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        logger.info("Watching %s for changes", self.path)
+        changes = self._watch_events() if watchfiles is not None else self._poll()
+        for batch in changes:
+            files = sorted(file for file in batch if file.suffix in WATCHED_SUFFIXES)
+            if not files:
+                continue
+            logger.info("Detected changes in %s files", len(files))
+            try:
+                self.on_change(files)
+            except Exception as error:  # noqa: BLE001
+                logger.warning("Failed to process changed files: %s", error)
+
+    def _watch_events(self) -> Iterator[set[Path]]:
+        for changes in watchfiles.watch(
+            self.path,
+            debounce=int(self.debounce * 1000),
+            stop_event=self._stop_event,
+            rust_timeout=int(POLL_INTERVAL * 1000),
+            yield_on_timeout=False,
+        ):
+            yield {Path(path) for _, path in changes}
+
+    def _poll(self) -> Iterator[set[Path]]:
+        snapshot = self._snapshot
+        pending: set[Path] = set()
+        last_change = 0.0
+        while not self._stop_event.wait(min(POLL_INTERVAL, self.debounce) if pending else POLL_INTERVAL):
+            new_snapshot = _take_snapshot(self.path)
+            changed = _changed_files(snapshot, new_snapshot)
+            snapshot = new_snapshot
+            if changed:
+                pending.update(changed)
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= self.debounce:
+                yield pending
+                pending = set()
@@ -1,5 +1,10 @@
 import pytest
 
+from src.robocop_mcp.config import Config, get_config
+from src.robocop_mcp.executor import shutdown_executors
+from src.robocop_mcp.mcp_check import clear_result_store
+from src.robocop_mcp.results import clear_results
+
 
 @pytest.fixture
 def test_1():
@@ -133,3 +138,26 @@ ignore = ["DOC02", "DOC03", "COM04"]
 rule_priority = ["ARG01"]
 
 """
+
+
+@pytest.fixture(autouse=True)
+def robocop_mcp_cache_dir(tmp_path_factory, monkeypatch):
+    cache_dir = tmp_path_factory.mktemp("robocop_mcp_cache")
+    monkeypatch.setenv("ROBOCOPMCP_CACHE_DIR", str(cache_dir))
+    clear_result_store()
+    clear_results()
+    return cache_dir
+
+
+@pytest.fixture
+def robocop_mcp_toml(tmp_path, monkeypatch):
+    """Write robocop_mcp settings to pyproject.toml, use it as the config file and return the config."""
+
+    def write(text: str) -> Config:
+        toml_file = tmp_path / "pyproject.toml"
+        toml_file.write_text(f"[tool.robocop_mcp]\n{text}\n")
+        monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+        return get_config()
+
+    yield write
+    shutdown_executors()
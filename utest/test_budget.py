@@ -0,0 +1,234 @@
+import asyncio
+import dataclasses
+import time
+from pathlib import Path
+
+import pytest
+from robocop.source_file import SourceFile
+
+from src.robocop_mcp import mcp_check
+from src.robocop_mcp.config import get_config
+from src.robocop_mcp.executor import run_single_flight
+from src.robocop_mcp.linter import CachedLinter
+from src.robocop_mcp.mcp_check import Violation, filter_violations, has_enough_violations, run_robocop
+from src.robocop_mcp.mcp_format import robocop_format
+from src.robocop_mcp.server import get_robocop_report, get_robocop_report_json
+
+
+@pytest.fixture
+def suite(tmp_path, test_1):
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(4):
+        (suite / f"test_{index}.robot").write_text(test_1)
+    return suite
+
+
+def test_budget_settings(robocop_mcp_toml):
+    robocop_mcp_toml("timeout = 2.5\nmax_files = 100")
+    config = get_config()
+    assert config.timeout == 2.5
+    assert config.max_files == 100
+    robocop_mcp_toml('timeout = -1\nmax_files = "many"')
+    config = get_config()
+    assert config.timeout is None
+    assert config.max_files is None
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_checks_only_max_files(robocop_mcp_toml, suite):
+    robocop_mcp_toml("max_files = 2")
+    result = await run_robocop(str(suite))
+    assert {violation.file.name for violation in result} == {"test_0.robot", "test_1.robot"}
+    assert result.note == "Partial result, 2 of 4 files were not checked: max_files limit 2 reached."
+    report = await get_robocop_report(str(suite))
+    assert report.endswith(f"\n\n## Partial result\n\n{result.note}")
+    assert '"note":"Partial result, 2 of 4' in await get_robocop_report_json(str(suite))
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_stops_checking_after_timeout(robocop_mcp_toml, suite, monkeypatch):
+    robocop_mcp_toml("timeout = 0.05")
+    monkeypatch.setattr(mcp_check, "CHECK_BATCH_SIZE", 1)
+    lint_files = mcp_check.lint_files
+    checked = []
+
+    def slow_lint_files(**kwargs: object) -> list:
+        time.sleep(0.1)
+        checked.extend(kwargs["sources"])
+        return lint_files(**kwargs)
+
+    monkeypatch.setattr(mcp_check, "lint_files", slow_lint_files)
+    result = await run_robocop(str(suite))
+    assert len(checked) == 1
+    assert result.note == "Partial result, 3 of 4 files were not checked: timeout of 0.05 seconds reached."
+    assert {violation.file for violation in result} == set(checked)
+
+    config = dataclasses.replace(get_config(), timeout=None)
+    monkeypatch.setattr(mcp_check, "get_config", lambda: config)
+    checked.clear()
+    result = await run_robocop(str(suite))
+    assert result.note == ""
+    assert len(checked) == 3
+    assert len({violation.file for violation in result}) == 4
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_stops_early_when_report_has_enough_violations(
+    robocop_mcp_toml, suite, monkeypatch
+):
+    robocop_mcp_toml("cache = false\nviolation_count = 2")
+    full = await run_robocop(str(suite))
+    monkeypatch.setattr(mcp_check, "CHECK_BATCH_SIZE", 1)
+    checked = []
+    lint_files = mcp_check.lint_files
+
+    def counting_lint_files(**kwargs: object) -> list:
+        checked.extend(kwargs["sources"])
+        return lint_files(**kwargs)
+
+    monkeypatch.setattr(mcp_check, "lint_files", counting_lint_files)
+    result = await run_robocop(str(suite), stop_early=True)
+    assert len(checked) == 2
+    assert filter_violations(result) == filter_violations(full)
+    assert result.note == (
+        "Partial result, 2 of 4 files were not checked: "
+        "enough violations found, violation counts are estimated."
+    )
+    robocop_mcp_toml("cache = false\nviolation_count = 2\nearly_exit = true")
+    checked.clear()
+    report = await get_robocop_report(str(suite))
+    assert len(checked) == 2
+    assert report.endswith(f"\n\n## Partial result\n\n{result.note}")
+
+
+def test_has_enough_violations_waits_for_priority_rule(robocop_mcp_toml):
+    robocop_mcp_toml('violation_count = 2\nrule_priority = ["DOC02"]')
+    config = get_config()
+
+    def violation(rule_id: str) -> Violation:
+        return Violation(Path("test.robot"), 1, 1, 1, 1, "WARNING", rule_id, "description")
+
+    assert not has_enough_violations([violation("COM04"), violation("COM04")], config)
+    assert not has_enough_violations([violation("COM04"), violation("DOC02")], config)
+    assert has_enough_violations([violation("DOC02"), violation("COM04"), violation("DOC02")], config)
+    config = dataclasses.replace(config, rule_priority=[], rule_ignore=["COM04"])
+    assert not has_enough_violations([violation("COM04"), violation("COM04")], config)
+    assert has_enough_violations([violation("COM04"), violation("DOC03"), violation("DOC03")], config)
+    config = dataclasses.replace(config, rule_priority=["NAME07"], rule_ignore=["COM04"])
+    violations = [violation("COM04"), violation("DOC02"), violation("DOC02")]
+    assert not has_enough_violations(violations, config)
+    assert has_enough_violations(violations, config, frozenset({"DOC02"}))
+    assert not has_enough_violations(violations, config, frozenset({"DOC02", "NAME07"}))
+    assert not has_enough_violations(violations, config, frozenset({"COM04"}))
+    assert has_enough_violations([violation("COM04"), *violations], config, frozenset({"COM04"}))
+
+
+@pytest.mark.asyncio
+async def test_rule_id_report_stops_early_with_rule_priority(robocop_mcp_toml, tmp_path, test_1, monkeypatch):
+    robocop_mcp_toml('cache = false\nearly_exit = true\nviolation_count = 2\nrule_priority = ["NAME07"]')
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(120):
+        (suite / f"test_{index:03}.robot").write_text(test_1)
+    checked = []
+    lint_files = mcp_check.lint_files
+
+    def counting_lint_files(**kwargs: object) -> list:
+        checked.extend(kwargs["sources"])
+        return lint_files(**kwargs)
+
+    monkeypatch.setattr(mcp_check, "lint_files", counting_lint_files)
+    report = await get_robocop_report(str(suite), rule_id="DOC02")
+    assert "DOC02" in report
+    assert len(checked) == mcp_check.CHECK_BATCH_SIZE
+    assert "enough violations found" in report
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_robocop_does_not_start_new_batches(robocop_mcp_toml, suite, monkeypatch):
+    robocop_mcp_toml("cache = false")
+    monkeypatch.setattr(mcp_check, "CHECK_BATCH_SIZE", 1)
+    monkeypatch.setattr(mcp_check, "QUIET_BATCH_FACTOR", 1)
+    checked = []
+
+    def slow_lint_files(**kwargs: object) -> list:
+        time.sleep(0.1)
+        checked.extend(kwargs["sources"])
+        return []
+
+    monkeypatch.setattr(mcp_check, "lint_files", slow_lint_files)
+    task = asyncio.ensure_future(run_robocop(str(suite)))
+    await asyncio.sleep(0.15)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0.3)
+    assert len(checked) == 2
+
+
+def test_batches_are_larger_without_progress_and_timeout(tmp_path):
+    files = [tmp_path / f"test_{index}.robot" for index in range(1200)]
+    counter = mcp_check.ProgressCounter(None, 0)
+    assert mcp_check.get_batch_count(files, 50, counter, stoppable=True) == 3
+    # Batches which are not stopped between files are small, so that cancel stops the work soon.
+    assert mcp_check.get_batch_count(files, 50, counter) == 24
+    budget = mcp_check.WorkBudget(timeout=10)
+    counter = mcp_check.ProgressCounter(None, 0, budget=budget)
+    assert mcp_check.get_batch_count(files, 50, counter, stoppable=True) == 24
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_robocop_stops_running_batch_between_files(
+    robocop_mcp_toml, suite, test_1, monkeypatch
+):
+    robocop_mcp_toml("cache = false")
+    for index in range(4, 20):
+        (suite / f"test_{index}.robot").write_text(test_1)
+    # Linter is created before the files are slowed down.
+    await run_robocop(str(suite / "test_0.robot"))
+    checked = []
+
+    def slow_run_check(_linter: CachedLinter, source_file: SourceFile, _rules: frozenset) -> list:
+        time.sleep(0.05)
+        checked.append(source_file.path)
+        return []
+
+    monkeypatch.setattr(CachedLinter, "_run_check", slow_run_check)
+    task = asyncio.ensure_future(run_robocop(str(suite)))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(1.2)
+    assert 0 < len(checked) < 20
+
+
+@pytest.mark.asyncio
+async def test_robocop_format_formats_only_max_files(robocop_mcp_toml, suite, test_1):
+    robocop_mcp_toml("max_files = 3")
+    report = await robocop_format(suite)
+    assert "3 files reformatted, 0 files left unchanged." in report
+    assert report.endswith("\nPartial result, 1 of 4 files were not formatted: max_files limit 3 reached.")
+    assert (suite / "test_3.robot").read_text() == test_1
+
+
+@pytest.mark.asyncio
+async def test_run_single_flight_cancels_call_when_all_callers_are_cancelled():
+    cancelled = asyncio.Event()
+
+    async def work() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.ensure_future(run_single_flight("key", work))
+    second = asyncio.ensure_future(run_single_flight("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+    second.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
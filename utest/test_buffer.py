@@ -0,0 +1,88 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.robocop_mcp.mcp_buffer import diff_text, format_text, lint_text, resolve_buffer_path
+from src.robocop_mcp.mcp_check import run_robocop
+from src.robocop_mcp.mcp_format import robocop_format
+from src.robocop_mcp.server import get_robocop_buffer_report, run_robocop_format_buffer
+
+
+@pytest.mark.asyncio
+async def test_lint_text_matches_check_of_saved_file(tmp_path, monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    robot_file = tmp_path / "sample.robot"
+    result = lint_text(test_1, str(robot_file))
+    assert not robot_file.exists()
+    robot_file.write_text(test_1)
+    assert result == await run_robocop(str(robot_file))
+
+
+def test_lint_text_uses_robocop_configuration(tmp_path, monkeypatch, test_1, robocop_toml_file_content):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    robocop_toml = tmp_path / "robocop.toml"
+    robocop_toml.write_text(robocop_toml_file_content)
+    monkeypatch.setenv("ROBOCOPMCP_ROBOCOP_CONFIG_FILE", str(robocop_toml))
+    rule_ids = {violation.rule_id for violation in lint_text(test_1, "sample.robot")}
+    assert rule_ids
+    assert not rule_ids & {"DOC02", "DOC03", "COM04"}
+
+
+def test_lint_text_file_name_decides_file_type():
+    keywords = "*** Keywords ***\nMy Keyword\n    No Operation\n"
+    assert resolve_buffer_path(None).name == "buffer.robot"
+    assert resolve_buffer_path("tests/a.resource").is_absolute()
+    resource_rules = {violation.rule_id for violation in lint_text(keywords, "tests/a.resource")}
+    assert "DOC04" in resource_rules
+    assert "DOC04" not in {violation.rule_id for violation in lint_text(keywords, "tests/a.robot")}
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_buffer_report(monkeypatch, test_1, test_no_errors):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    report = await get_robocop_buffer_report(test_1, "sample.robot")
+    assert report.startswith("# Robocop Report\n\n## Violation for file sample.robot in line 1 rule COM04")
+    assert "result id: r1" in report
+    clean_report = await get_robocop_buffer_report(test_no_errors, "clean.robot")
+    assert clean_report == "# Robocop Report\n\nNo violations found."
+
+
+@pytest.mark.asyncio
+async def test_format_text_matches_format_of_saved_file(tmp_path, monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    robot_file = tmp_path / "sample.robot"
+    formatted = format_text(test_1, str(robot_file))
+    assert not robot_file.exists()
+    assert formatted != test_1
+    robot_file.write_text(test_1)
+    await robocop_format(robot_file)
+    assert robot_file.read_text() == formatted
+    assert format_text(formatted, str(robot_file)) == formatted
+
+
+def test_format_text_sees_changes_in_discovered_configuration(tmp_path, monkeypatch):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    robocop_toml = suite / "robocop.toml"
+    robocop_toml.write_text("[format]\nspace_count = 4\n")
+    text = "*** Test Cases ***\nTest\n  Log  Hello\n"
+    assert format_text(text, str(suite / "buffer.robot")) == "*** Test Cases ***\nTest\n    Log    Hello\n"
+    robocop_toml.write_text("[format]\nspace_count = 8\n")
+    formatted = format_text(text, str(suite / "buffer.robot"))
+    assert formatted == "*** Test Cases ***\nTest\n        Log        Hello\n"
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_format_buffer_returns_text_or_diff(monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    formatted = await run_robocop_format_buffer(test_1, "sample.robot")
+    diff = await run_robocop_format_buffer(test_1, "sample.robot", diff=True)
+    assert diff.startswith("--- sample.robot\tbefore\n+++ sample.robot\tafter\n")
+    assert diff == diff_text(test_1, formatted, "sample.robot")
+    # Formatter removes the empty line from the beginning of the file.
+    assert "\n-\n *** Test Cases ***\n" in diff
+    assert await run_robocop_format_buffer(formatted, "sample.robot", diff=True) == ""
+    with patch("src.robocop_mcp.server.format_text", side_effect=Exception("Format error occurred")):
+        error = await run_robocop_format_buffer(test_1)
+    assert error == "Error during formatting: Format error occurred"
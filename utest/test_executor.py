@@ -0,0 +1,223 @@
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.robocop_mcp import mcp_check, mcp_format
+from src.robocop_mcp.config import get_config
+from src.robocop_mcp.executor import (
+    get_executor,
+    get_process_executor,
+    run_in_process_pool,
+    run_single_flight,
+    shutdown_executors,
+    start_process_pool,
+)
+from src.robocop_mcp.mcp_check import Violation, run_robocop, split_into_shards
+from src.robocop_mcp.mcp_format import robocop_format
+
+
+def test_get_executor_defaults_to_shared_thread_pool(monkeypatch):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    config = get_config()
+    executor = get_executor(config)
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert get_executor(config) is executor
+    shutdown_executors()
+
+
+def test_get_executor_with_invalid_values_uses_defaults(robocop_mcp_toml):
+    config = robocop_mcp_toml('executor = "fork"\nmax_workers = "many"')
+    assert config.executor == "thread"
+    assert config.max_workers is None
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_in_process_pool(tmp_path, robocop_mcp_toml, test_2):
+    config = robocop_mcp_toml('executor = "process"\nmax_workers = 1')
+    assert isinstance(get_executor(config), ProcessPoolExecutor)
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_2)
+    result = await run_robocop(str(robot_file))
+    assert result
+    assert all(isinstance(violation, Violation) for violation in result)
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_does_not_block_event_loop(tmp_path, robocop_mcp_toml, test_2):
+    robocop_mcp_toml("max_workers = 2")
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_2)
+    ticks = []
+
+    async def ticker() -> None:
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    def slow_lint_files(**_: object) -> list:
+        time.sleep(0.2)
+        return []
+
+    with patch("src.robocop_mcp.mcp_check.lint_files", side_effect=slow_lint_files):
+        result, _ = await asyncio.gather(run_robocop(str(robot_file)), ticker())
+    assert result == []
+    assert len(ticks) == 5
+    assert ticks[-1] - ticks[0] < 0.2
+
+
+def test_split_into_shards_balances_file_sizes(tmp_path):
+    files = []
+    for index, size in enumerate([100, 60, 50, 40, 10]):
+        file = tmp_path / f"test_{index}.robot"
+        file.write_text("x" * size)
+        files.append(file)
+    shards = split_into_shards(files, 2)
+    assert sorted(file for shard in shards for file in shard) == sorted(files)
+    totals = sorted(sum(file.stat().st_size for file in shard) for shard in shards)
+    assert totals == [120, 140]
+    assert split_into_shards(files[:1], 4) == [[files[0]]]
+    assert split_into_shards([], 4) == []
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_parallel_matches_serial_run(tmp_path, robocop_mcp_toml, test_1, test_2):
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(4):
+        (suite / f"test_{index}.robot").write_text(test_1 if index % 2 else test_2)
+    robocop_mcp_toml("max_workers = 2")
+    serial = await run_robocop(str(suite))
+    robocop_mcp_toml("max_workers = 2\nparallel = true")
+    parallel = await run_robocop(str(suite))
+    assert parallel == serial
+    assert {violation.file.name for violation in parallel} == {f"test_{index}.robot" for index in range(4)}
+
+
+@pytest.mark.asyncio
+async def test_robocop_format_parallel_matches_serial_format(tmp_path, robocop_mcp_toml, test_1, test_2):
+    serial_suite, parallel_suite = tmp_path / "serial", tmp_path / "parallel"
+    for suite in (serial_suite, parallel_suite):
+        suite.mkdir()
+        for index in range(4):
+            (suite / f"test_{index}.robot").write_text(test_1 if index % 2 else test_2)
+    robocop_mcp_toml("max_workers = 2\ncache = false")
+    await robocop_format(serial_suite)
+    robocop_mcp_toml("max_workers = 2\ncache = false\nparallel = true")
+    report = await robocop_format(parallel_suite)
+    assert report.endswith("\n4 files reformatted, 0 files left unchanged.")
+    assert len([line for line in report.splitlines() if line.startswith("Reformatted ")]) == 4
+    for index in range(4):
+        name = f"test_{index}.robot"
+        assert (parallel_suite / name).read_text() == (serial_suite / name).read_text()
+
+
+@pytest.mark.asyncio
+async def test_run_single_flight_shares_running_call():
+    calls = []
+
+    async def work() -> list[int]:
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return [1, 2]
+
+    first, second = await asyncio.gather(run_single_flight("key", work), run_single_flight("key", work))
+    assert first is second
+    assert len(calls) == 1
+    assert await run_single_flight("other", work) == [1, 2]
+    assert await run_single_flight("key", work) == [1, 2]
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_run_single_flight_cancelled_caller_does_not_cancel_call():
+    async def work() -> str:
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.ensure_future(run_single_flight("key", work))
+    second = asyncio.ensure_future(run_single_flight("key", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_checks_run_robocop_once(tmp_path, robocop_mcp_toml, test_2):
+    robocop_mcp_toml("max_workers = 2\ncache = false")
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_2)
+    with patch("src.robocop_mcp.mcp_check.lint_files", wraps=mcp_check.lint_files) as lint_files:
+        first, second = await asyncio.gather(run_robocop(str(robot_file)), run_robocop(str(robot_file)))
+    assert first == second
+    assert first
+    lint_files.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_formats_run_formatter_once(tmp_path, robocop_mcp_toml, test_2):
+    robocop_mcp_toml("max_workers = 2\ncache = false")
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_2)
+    with patch("src.robocop_mcp.mcp_format.format_files", wraps=mcp_format.format_files) as format_files:
+        first, second = await asyncio.gather(robocop_format(robot_file), robocop_format(robot_file))
+    assert first == second
+    format_files.assert_called_once()
+
+
+def _worker_state() -> tuple[int, int]:
+    rule_modules = [name for name in sys.modules if name.startswith("robocop.linter.rules.")]
+    return os.getpid(), len(rule_modules)
+
+
+def test_process_pool_is_rebuilt_when_configuration_changes(robocop_mcp_toml):
+    config = robocop_mcp_toml('executor = "process"\nmax_workers = 1')
+    executor = get_executor(config)
+    assert get_process_executor(config) is executor
+    config = robocop_mcp_toml('executor = "process"\nmax_workers = 1\ncache_size = 100')
+    assert get_executor(config) is not executor
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="max_tasks_per_child requires Python 3.11")
+def test_process_pool_workers_are_warmed_up_and_recycled(robocop_mcp_toml):
+    config = robocop_mcp_toml('executor = "process"\nmax_workers = 1\nmax_tasks_per_worker = 2')
+    assert config.max_tasks_per_worker == 2
+    start_process_pool(config)
+    executor = get_process_executor(config)
+    states = [executor.submit(_worker_state).result(timeout=60) for _ in range(3)]
+    assert all(rule_modules > 0 for _, rule_modules in states)
+    # The first worker handled the start up task and one job before it was replaced.
+    assert states[0][0] != states[1][0]
+    assert states[1][0] == states[2][0]
+
+
+# Set in the test process, forked worker would inherit it, spawned worker imports the module again.
+_PARENT_STATE: list[str] = []
+
+
+def _slow_worker_state(seconds: float) -> tuple[int, bool]:
+    time.sleep(seconds)
+    return os.getpid(), bool(_PARENT_STATE)
+
+
+@pytest.mark.asyncio
+async def test_process_pool_rebuild_does_not_break_running_calls(robocop_mcp_toml, monkeypatch):
+    old_config = robocop_mcp_toml('executor = "process"\nmax_workers = 1')
+    new_config = robocop_mcp_toml('executor = "process"\nmax_workers = 1\ncache_size = 100')
+    monkeypatch.setattr(sys.modules[__name__], "_PARENT_STATE", ["parent"])
+    old_job = asyncio.ensure_future(run_in_process_pool(old_config, _slow_worker_state, 0.5))
+    await asyncio.sleep(0.1)
+    new_pid, new_forked = await run_in_process_pool(new_config, _slow_worker_state, 0)
+    # Call with the old configuration after the rebuild gets a pool, instead of a shut down pool.
+    results = await asyncio.gather(
+        old_job,
+        run_in_process_pool(old_config, _slow_worker_state, 0),
+        run_in_process_pool(new_config, _slow_worker_state, 0),
+    )
+    assert results[0][0] != new_pid
+    assert not new_forked
+    assert not any(forked for _, forked in results)
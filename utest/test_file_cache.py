@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.robocop_mcp import mcp_check
+from src.robocop_mcp.file_cache import FileCache
+from src.robocop_mcp.mcp_check import run_robocop
+
+
+def test_file_cache_returns_value_only_for_matching_key(tmp_path):
+    cache = FileCache(tmp_path, "lint", 10)
+    file = tmp_path / "test.robot"
+    cache.set({file: ("key1", "value1")})
+    assert cache.get({file: "key1"}) == {file: "value1"}
+    assert cache.get({file: "key2"}) == {}
+    assert FileCache(tmp_path, "format", 10).get({file: "key1"}) == {}
+    cache.clear()
+    assert cache.get({file: "key1"}) == {}
+
+
+def test_file_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = FileCache(tmp_path, "lint", 2)
+    first, second, third = (tmp_path / f"test_{index}.robot" for index in range(3))
+    cache.set({first: ("key", "1")})
+    cache.set({second: ("key", "2")})
+    assert cache.get({first: "key"}) == {first: "1"}
+    cache.set({third: ("key", "3")})
+    assert cache.get({first: "key", second: "key", third: "key"}) == {first: "1", third: "3"}
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_checks_only_changed_files(tmp_path, monkeypatch, test_1, test_2):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(3):
+        (suite / f"test_{index}.robot").write_text(test_2)
+    first_run = await run_robocop(str(suite))
+    assert first_run
+
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        second_run = await run_robocop(str(suite))
+        lint_files.assert_not_called()
+        assert second_run == first_run
+
+        changed_file = suite / "test_1.robot"
+        changed_file.write_text(test_1)
+        third_run = await run_robocop(str(suite))
+        lint_files.assert_called_once()
+        assert lint_files.call_args.kwargs["sources"] == [changed_file.resolve()]
+    assert third_run != first_run
+    assert {violation.file.name for violation in third_run} == {f"test_{index}.robot" for index in range(3)}
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_without_cache(tmp_path, monkeypatch, test_2):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text("[tool.robocop_mcp]\ncache = false\n")
+    monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_2)
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        first_run = await run_robocop(str(robot_file))
+        second_run = await run_robocop(str(robot_file))
+    assert first_run == second_run
+    assert lint_files.call_count == 2
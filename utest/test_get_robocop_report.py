@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 from approvaltests import verify
 
+from src.robocop_mcp import mcp_check
 from src.robocop_mcp.server import (
     get_robocop_report,
 )
@@ -329,3 +332,45 @@ async def test_get_robocop_report_with_only_robocop_config_file(
     lines = [line for line in result.splitlines() if not line.startswith("file")]
     lines_filtered = "\n".join(lines)
     verify(lines_filtered)
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_checks_only_requested_rule(tmp_path, monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_1)
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        result = await get_robocop_report(str(robot_file), rule_id="missing-doc-test-case")
+    assert lint_files.call_args.kwargs["rules"] == frozenset({"DOC02"})
+    headings = [line for line in result.splitlines() if line.startswith("## Violation")]
+    assert headings == ["## Violation for file sample.robot in line 3 rule DOC02"]
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_priority_rules_first(tmp_path, monkeypatch, test_1):
+    toml_file = tmp_path / "pyproject.toml"
+    monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_1)
+    toml_file.write_text(
+        '[tool.robocop_mcp]\ncache = false\npriority_rules_first = true\nrule_priority = ["NAME07"]\n'
+    )
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        result = await get_robocop_report(str(robot_file))
+    lint_files.assert_called_once()
+    assert lint_files.call_args.kwargs["rules"] == frozenset({"NAME07"})
+    assert "rule NAME07" in result
+    assert "rule DOC02" not in result
+    assert result.endswith(
+        "\n\n## Partial result\n\nOnly rule_priority rules NAME07 were checked, other rules were not checked."
+    )
+
+    toml_file.write_text(
+        '[tool.robocop_mcp]\ncache = false\npriority_rules_first = true\nrule_priority = ["LEN08"]\n'
+    )
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        result = await get_robocop_report(str(robot_file))
+    assert lint_files.call_count == 2
+    assert "rules" not in lint_files.call_args.kwargs
+    assert "rule COM04" in result
+    assert "## Partial result" not in result
@@ -0,0 +1,83 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.robocop_mcp.git_changes import GitError, get_changed_files
+from src.robocop_mcp.server import get_robocop_report, run_robocop_format
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)  # noqa: S603, S607
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch, test_2):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    repo = tmp_path / "repo"
+    suite = repo / "suite"
+    suite.mkdir(parents=True)
+    for name in ("committed.robot", "modified.robot", "staged.robot", "deleted.robot"):
+        (suite / name).write_text(test_2)
+    (repo / ".gitignore").write_text("ignored.robot\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", ".")
+    _git(repo, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "init")
+    (suite / "modified.robot").write_text(test_2 + "\n")
+    (suite / "staged.robot").write_text(test_2 + "\n")
+    _git(repo, "add", "suite/staged.robot")
+    (suite / "deleted.robot").unlink()
+    (suite / "untracked.robot").write_text(test_2)
+    (suite / "untracked.txt").write_text("not robot")
+    (suite / "ignored.robot").write_text(test_2)
+    return repo
+
+
+def test_get_changed_files(git_repo):
+    suite = (git_repo / "suite").resolve()
+    changed = get_changed_files(git_repo / "suite", "HEAD")
+    assert sorted(changed) == [suite / "modified.robot", suite / "staged.robot", suite / "untracked.robot"]
+    assert get_changed_files(suite / "modified.robot", "HEAD") == [suite / "modified.robot"]
+    with pytest.raises(GitError):
+        get_changed_files(suite, "no-such-ref")
+
+
+def test_get_changed_files_does_not_accept_options_as_ref(git_repo, tmp_path):
+    output = tmp_path / "output.txt"
+    for ref in (f"--output={output}", "-p", "", f"HEAD --output={output}"):
+        with pytest.raises(GitError):
+            get_changed_files(git_repo / "suite", ref)
+    assert not output.exists()
+
+
+def test_get_changed_files_outside_git_repository(tmp_path):
+    with pytest.raises(GitError):
+        get_changed_files(tmp_path, "HEAD")
+    with pytest.raises(GitError, match="path does not exist"):
+        get_changed_files(tmp_path / "missing" / "test.robot", "HEAD")
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_checks_only_changed_files(git_repo):
+    report = await get_robocop_report(str(git_repo / "suite"), git_ref="HEAD")
+    checked = {line.split()[4] for line in report.splitlines() if line.startswith("## Violation for file")}
+    assert checked == {"modified.robot", "staged.robot", "untracked.robot"}
+    error = await get_robocop_report(str(git_repo / "suite"), git_ref="no-such-ref")
+    assert error.startswith("# Robocop Report\n\nCould not get changed files: git rev-parse")
+    missing = await get_robocop_report(str(git_repo / "missing.robot"), git_ref="HEAD")
+    assert missing.startswith("# Robocop Report\n\nCould not get changed files: path does not exist")
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_format_formats_only_changed_files(git_repo, test_2):
+    suite = git_repo / "suite"
+    report = await run_robocop_format(str(suite), git_ref="HEAD")
+    assert "3 files reformatted, 0 files left unchanged." in report
+    assert (suite / "committed.robot").read_text() == test_2
+    assert (suite / "ignored.robot").read_text() == test_2
+    _git(git_repo, "add", ".")
+    _git(git_repo, "-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "fmt")
+    assert await run_robocop_format(str(suite), git_ref="HEAD") == "No changed files compared to HEAD."
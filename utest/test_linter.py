@@ -0,0 +1,105 @@
+import os
+from pathlib import Path
+
+import pytest
+from robocop.config.manager import ConfigManager
+from robocop.config.schema import Config
+from robocop.run import check_files
+from robocop.source_file import SourceFile
+
+from src.robocop_mcp import mcp_check
+from src.robocop_mcp.linter import get_linter
+from src.robocop_mcp.mcp_buffer import lint_text
+from src.robocop_mcp.mcp_check import convert_to_violations, clear_result_store, lint_files, run_robocop
+
+
+@pytest.fixture
+def robot_files(tmp_path, test_1, test_2, test_3_duplicate_names):
+    files = []
+    for index, content in enumerate([test_1, test_2, test_3_duplicate_names]):
+        robot_file = tmp_path / f"test_{index}.robot"
+        robot_file.write_text(content)
+        files.append(robot_file)
+    return files
+
+
+def test_lint_files_matches_robocop_check_files(robot_files):
+    expected = check_files(sources=robot_files, return_result=True, silent=True, cache=False)
+    assert convert_to_violations(lint_files(robot_files, "fingerprint")) == convert_to_violations(expected)
+
+
+def test_lint_files_uses_configuration_file(tmp_path, robot_files, robocop_toml_file_content):
+    robocop_toml = tmp_path / "robocop.toml"
+    robocop_toml.write_text(robocop_toml_file_content)
+    expected = check_files(
+        sources=robot_files, configuration_file=robocop_toml, return_result=True, silent=True, cache=False
+    )
+    result = lint_files(robot_files, "fingerprint", robocop_toml)
+    assert convert_to_violations(result) == convert_to_violations(expected)
+
+
+def test_linter_is_reused_until_configuration_file_changes(tmp_path, robocop_toml_file_content):
+    robocop_toml = tmp_path / "robocop.toml"
+    robocop_toml.write_text(robocop_toml_file_content)
+    linter = get_linter(robocop_toml, "fingerprint")
+    assert get_linter(robocop_toml, "fingerprint") is linter
+    assert get_linter(robocop_toml, "other") is not linter
+    stat = robocop_toml.stat()
+    os.utime(robocop_toml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert get_linter(robocop_toml, "fingerprint") is not linter
+
+
+def test_lint_files_with_rules_matches_filtered_full_check(robot_files, robocop_toml_file_content, tmp_path):
+    robocop_toml = tmp_path / "robocop.toml"
+    robocop_toml.write_text(robocop_toml_file_content)
+    for configuration_file in (None, robocop_toml):
+        full = convert_to_violations(lint_files(robot_files, "fingerprint", configuration_file))
+        for rules in ({"DOC02"}, {"LEN08", "NAME07"}, {"COM04"}):
+            subset = convert_to_violations(
+                lint_files(robot_files, "fingerprint", configuration_file, frozenset(rules))
+            )
+            assert subset == [violation for violation in full if violation.rule_id in rules]
+    assert lint_files(robot_files, "fingerprint", None, frozenset({"NOPE99"})) == []
+
+
+def test_linter_lock_is_taken_per_file(robot_files, monkeypatch):
+    linter = get_linter(None, "fingerprint")
+    get_config = ConfigManager.get_config_for_source_file
+    run_check = linter.linter.run_check
+    locked = []
+
+    def record_config_lock(config_manager: ConfigManager, source: Path) -> Config:
+        locked.append(("config", linter.lock.locked()))
+        return get_config(config_manager, source)
+
+    def record_check_lock(source_file: SourceFile) -> list:
+        locked.append(("check", linter.lock.locked()))
+        return run_check(source_file)
+
+    monkeypatch.setattr(ConfigManager, "get_config_for_source_file", record_config_lock)
+    monkeypatch.setattr(linter.linter, "run_check", record_check_lock)
+    linter.check_files(robot_files)
+    # Other calls sharing the linter can take the lock between the files of a check.
+    assert locked == [("config", False), ("check", True)] * len(robot_files)
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_sees_changes_in_discovered_configuration(tmp_path, monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    monkeypatch.setattr(mcp_check, "get_cache_dir", lambda: tmp_path / "cache")
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    (suite / "test.robot").write_text(test_1)
+    robocop_toml = suite / "robocop.toml"
+    robocop_toml.write_text('[lint]\nignore = ["COM04"]\n')
+    first = {violation.rule_id for violation in await run_robocop(str(suite))}
+    assert "DOC02" in first
+    assert "COM04" not in first
+    robocop_toml.write_text('[lint]\nignore = ["COM04", "DOC02"]\n')
+    second = {violation.rule_id for violation in await run_robocop(str(suite))}
+    assert second == first - {"DOC02"}
+    buffer = {violation.rule_id for violation in lint_text(test_1, str(suite / "buffer.robot"))}
+    assert buffer == second
+    # Result of the second check is stored with the new configuration.
+    clear_result_store()
+    assert {violation.rule_id for violation in await run_robocop(str(suite))} == second
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import pytest
+from mcp.types import RequestParams
+
+from src.robocop_mcp import mcp_check, mcp_format
+from src.robocop_mcp.mcp_check import run_robocop
+from src.robocop_mcp.mcp_format import _merge_reports, robocop_format
+from src.robocop_mcp.server import _check_progress, _format_progress, get_robocop_report
+
+
+class ProgressRecorder:
+    def __init__(self, progress_token: int | None = 1) -> None:
+        self.calls: list[tuple] = []
+        self.request_context = SimpleNamespace(meta=RequestParams.Meta(progressToken=progress_token))
+
+    async def __call__(self, done: int, total: int, violations: int) -> None:
+        self.calls.append((done, total, violations))
+
+    async def report_progress(
+        self, progress: float, total: float | None = None, message: str | None = None
+    ) -> None:
+        self.calls.append((progress, total, message))
+
+
+@pytest.fixture
+def suite(tmp_path, monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(3):
+        (suite / f"test_{index}.robot").write_text(test_1)
+    return suite
+
+
+@pytest.mark.asyncio
+async def test_run_robocop_reports_progress_per_batch(suite, monkeypatch):
+    monkeypatch.setattr(mcp_check, "CHECK_BATCH_SIZE", 1)
+    progress = ProgressRecorder()
+    result = await run_robocop(str(suite), progress)
+    assert [call[:2] for call in progress.calls] == [(1, 3), (2, 3), (3, 3)]
+    assert progress.calls[-1][2] == len(result)
+
+    cached_progress = ProgressRecorder()
+    assert await run_robocop(str(suite), cached_progress) == result
+    assert cached_progress.calls == [(3, 3, len(result))]
+
+
+@pytest.mark.asyncio
+async def test_robocop_format_reports_progress_and_merges_summary(suite, monkeypatch):
+    monkeypatch.setattr(mcp_format, "FORMAT_BATCH_SIZE", 2)
+    progress = ProgressRecorder()
+    report = await robocop_format(suite, progress)
+    assert progress.calls == [(1, 3, 0), (3, 3, 0)]
+    assert report.endswith("\n\n3 files reformatted, 0 files left unchanged.")
+    assert len([line for line in report.splitlines() if line.startswith("Reformatted ")]) == 3
+
+
+def test_merge_reports_combines_summaries():
+    reports = [
+        "\n1 file would be reformatted, 0 files would be left unchanged.",
+        (
+            "Failed to decode a.robot\n\n"
+            "0 files would be reformatted, 1 file would be left unchanged. 1 file would be skipped."
+        ),
+    ]
+    assert _merge_reports(reports) == (
+        "Failed to decode a.robot\n\n"
+        "1 file would be reformatted, 1 file would be left unchanged. 1 file would be skipped."
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_sends_progress_notifications(suite):
+    ctx = ProgressRecorder()
+    await get_robocop_report(str(suite), ctx)
+    assert ctx.calls
+    done, total, message = ctx.calls[-1]
+    assert (done, total) == (3, 3)
+    assert message.startswith("Checked 3/3 files, found ")
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_checks_in_one_batch_without_progress_token(suite, monkeypatch):
+    monkeypatch.setattr(mcp_check, "CHECK_BATCH_SIZE", 1)
+    ctx = ProgressRecorder(progress_token=None)
+    assert _check_progress(ctx) is None
+    assert _format_progress(ctx) is None
+    batches = []
+    lint_files = mcp_check.lint_files
+
+    def recording_lint_files(**kwargs: object) -> list:
+        batches.append(kwargs["sources"])
+        return lint_files(**kwargs)
+
+    monkeypatch.setattr(mcp_check, "lint_files", recording_lint_files)
+    await get_robocop_report(str(suite), ctx)
+    assert ctx.calls == []
+    assert len(batches) == 1
@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.robocop_mcp.config import get_config
+from src.robocop_mcp.mcp_check import Violation, expand_paths, format_report, run_robocop
+from src.robocop_mcp.report import group_violations, render_json
+from src.robocop_mcp.results import store_result
+from src.robocop_mcp.server import get_robocop_batch_report, get_robocop_report_json
+
+
+def _violation(file: str, rule_id: str, line: int) -> Violation:
+    return Violation(Path(file), line, line, 1, 10, "WARNING", rule_id, f"{rule_id} in line {line}")
+
+
+def test_group_violations_by_file_and_rule():
+    violations = [
+        _violation("a.robot", "DOC02", 1),
+        _violation("b.robot", "DOC02", 1),
+        _violation("a.robot", "LEN01", 2),
+        _violation("a.robot", "DOC02", 3),
+    ]
+    grouped = group_violations(violations)
+    assert [file.file.name for file in grouped] == ["a.robot", "b.robot"]
+    assert [rule.rule_id for rule in grouped[0].rules] == ["DOC02", "LEN01"]
+    assert [violation.start_line for violation in grouped[0].rules[0].violations] == [1, 3]
+
+
+def test_render_json_is_compact(monkeypatch):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    violations = [_violation(f"test_{index % 10}.robot", "DOC02", index) for index in range(200)]
+    result = store_result("tests", violations)
+    report = render_json(result, get_config())
+    data = json.loads(report)
+    assert data["id"] == result.result_id
+    assert data["n"] == 200
+    assert data["files"][0]["f"] == "test_0.robot"
+    assert data["files"][0]["r"][0] == {
+        "id": "DOC02",
+        "s": "W",
+        "v": [[line, 1, line, 10, f"DOC02 in line {line}"] for line in range(0, 200, 10)],
+    }
+    markdown = "\n".join(line for violation in violations for line in format_report(violation))
+    assert len(report) * 3 < len(markdown)
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_json_without_ignored_rules(tmp_path, monkeypatch, test_1, toml_file_ignore):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text(toml_file_ignore)
+    monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(test_1)
+    data = json.loads(await get_robocop_report_json(str(robot_file)))
+    rule_ids = {rule["id"] for file in data["files"] for rule in file["r"]}
+    assert rule_ids
+    assert not rule_ids & {"DOC02", "DOC03", "COM04"}
+    assert data["n"] == sum(len(rule["v"]) for file in data["files"] for rule in file["r"])
+
+
+def test_expand_paths_with_globs(tmp_path, monkeypatch):
+    for name in ("a.robot", "b.robot", "c.resource"):
+        (tmp_path / name).write_text("")
+    monkeypatch.chdir(tmp_path)
+    sources, missing = expand_paths(
+        ["*.robot", str(tmp_path / "*.resource"), "a.robot", "none/*.robot", "x.robot"]
+    )
+    assert sources == [tmp_path / "a.robot", tmp_path / "b.robot", tmp_path / "c.resource"]
+    assert missing == ["none/*.robot", "x.robot"]
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_batch_report(tmp_path, monkeypatch, test_1, test_2):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    suite = tmp_path / "suite"
+    (suite / "sub").mkdir(parents=True)
+    (suite / "test_1.robot").write_text(test_1)
+    (suite / "sub" / "test_2.robot").write_text(test_2)
+    (suite / "sub" / "test_3.robot").write_text(test_2)
+    monkeypatch.chdir(tmp_path)
+    data = json.loads(await get_robocop_batch_report(["suite/*.robot", "suite/sub", "missing.robot"]))
+    assert data["note"] == "No files found for: missing.robot."
+    expected = [*await run_robocop(str(suite / "test_1.robot")), *await run_robocop(str(suite / "sub"))]
+    assert data["n"] == len(expected)
+    assert {file["f"] for file in data["files"]} == {str(violation.file) for violation in expected}
+    empty = json.loads(await get_robocop_batch_report(["missing/*.robot"]))
+    assert empty["n"] == 0
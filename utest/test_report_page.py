@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.robocop_mcp import mcp_check
+from src.robocop_mcp.results import MAX_STORED_RESULTS, decode_cursor, get_result, store_result
+from src.robocop_mcp.server import get_robocop_report, get_robocop_report_page
+
+ROBOT = "*** Test Cases ***\n" + "".join(f"Example Test {index}\n    Log    Hello\n" for index in range(5))
+
+
+def _lines(report: str, prefix: str) -> list[str]:
+    return [line for line in report.splitlines() if line.startswith(prefix)]
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_page_pages_stored_result(tmp_path, monkeypatch):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text('[tool.robocop_mcp]\nviolation_count = 2\nrule_priority = ["DOC02"]\n')
+    monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+    robot_file = tmp_path / "sample.robot"
+    robot_file.write_text(ROBOT)
+    report = await get_robocop_report(str(robot_file))
+    assert _lines(report, "result id:") == ["result id: r1"]
+    assert _lines(report, "next cursor:") == ["next cursor: DOC02:2"]
+    assert "DOC02 (5)" in _lines(report, "rules with violations:")[0]
+
+    with patch.object(mcp_check, "lint_files") as lint_files:
+        second = await get_robocop_report_page("r1", cursor="DOC02:2")
+        third = await get_robocop_report_page("r1", cursor="DOC02:4")
+        other_rule = await get_robocop_report_page("r1", rule_id="missing-doc-suite")
+        lint_files.assert_not_called()
+    assert _lines(second, "rule id:") == ["rule id: DOC02", "rule id: DOC02"]
+    assert _lines(second, "next cursor:") == ["next cursor: DOC02:4"]
+    assert _lines(third, "rule id:") == ["rule id: DOC02"]
+    assert _lines(third, "next cursor:") == []
+    assert _lines(other_rule, "rule id:") == ["rule id: DOC03"]
+
+
+@pytest.mark.asyncio
+async def test_get_robocop_report_page_errors():
+    assert "Result r404 not found" in await get_robocop_report_page("r404", cursor="DOC02:2")
+    result = store_result("sample.robot", [])
+    assert "Invalid cursor: DOC02" in await get_robocop_report_page(result.result_id, cursor="DOC02")
+    assert "Give either cursor or rule_id" in await get_robocop_report_page(result.result_id)
+    assert "No violations for rule DOC02" in await get_robocop_report_page(result.result_id, rule_id="DOC02")
+
+
+def test_stored_results_are_bounded():
+    results = [store_result(f"{index}.robot", []) for index in range(MAX_STORED_RESULTS + 1)]
+    assert get_result(results[0].result_id) is None
+    assert get_result(results[-1].result_id) is results[-1]
+    assert decode_cursor("DOC02:20") == ("DOC02", 20)
+    assert decode_cursor("DOC02:x") is None
@@ -4,12 +4,16 @@ import src.robocop_mcp.config as config_module
 from src.robocop_mcp.config import (
     Config,
     _get_rule_ignore,
+    clear_config_cache,
     get_config,
     Rule,
     _get_robocop_rules,
     _get_user_rule_fixes,
     _get_robocop_rule_name,
+    get_rule_id_by_name_or_id,
     _get_predefined_fixes,
+    _get_cached_robocop_rules,
+    RULES_SNAPSHOT_FILE,
 )
 from src.robocop_mcp.mcp_check import Violation, run_robocop
 
@@ -85,6 +89,15 @@ def test_get_robocop_rule_name_converts_unknown_to_lowercase():
     assert result == "unknown_rule_id"
 
 
+def test_get_rule_id_by_name_or_id_is_case_insensitive():
+    assert get_rule_id_by_name_or_id("DOC01") == "DOC01"
+    assert get_rule_id_by_name_or_id("doc01") == "DOC01"
+    assert get_rule_id_by_name_or_id("missing-doc-keyword") == "DOC01"
+    assert get_rule_id_by_name_or_id("Missing-Doc-Keyword") == "DOC01"
+    assert get_rule_id_by_name_or_id("not-a-rule") is None
+    assert _get_robocop_rule_name("doc01") == "missing-doc-keyword"
+
+
 def test_get_rule_ignore_normalizes_string_to_list_format(tmp_path):
     config = {"ignore": "DOC02"}
     result = _get_rule_ignore(config, tmp_path / "pyproject.toml")
@@ -103,3 +116,33 @@ def test_get_predefined_fixes_discovers_rules_from_files(tmp_path, monkeypatch):
     assert result["UNKNOWN"].rule_id == "UNKNOWN"
     assert result["UNKNOWN"].instruction == "Instruction text."
     assert result["UNKNOWN"].name == "unknown"
+
+
+def test_get_config_is_cached_until_toml_changes(tmp_path, monkeypatch):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text("[tool.robocop_mcp]\nviolation_count = 5\n")
+    monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+    config = get_config()
+    assert get_config() is config
+    toml_file.write_text("[tool.robocop_mcp]\nviolation_count = 15\n")
+    changed_config = get_config()
+    assert changed_config is not config
+    assert changed_config.violation_count == 15
+    clear_config_cache()
+    assert get_config() is not changed_config
+
+
+def test_get_cached_robocop_rules_uses_snapshot(robocop_mcp_cache_dir, monkeypatch):
+    rules = _get_cached_robocop_rules()
+    assert (robocop_mcp_cache_dir / RULES_SNAPSHOT_FILE).is_file()
+    monkeypatch.setattr(config_module, "_get_robocop_rules", dict)
+    assert _get_cached_robocop_rules() == rules
+
+
+def test_get_cached_robocop_rules_resolves_when_snapshot_key_differs(robocop_mcp_cache_dir, monkeypatch):
+    snapshot = robocop_mcp_cache_dir / RULES_SNAPSHOT_FILE
+    snapshot.write_text('{"key": "other", "rules": []}')
+    rules = {"DOC01": Rule("DOC01", "Add documentation", "missing-doc-keyword")}
+    monkeypatch.setattr(config_module, "_get_robocop_rules", lambda: rules)
+    assert _get_cached_robocop_rules() == rules
+    assert '"other"' not in snapshot.read_text()
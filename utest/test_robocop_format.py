@@ -1,8 +1,14 @@
+import asyncio
+import sys
+import threading
 from unittest.mock import patch
 
 import pytest
 from approvaltests.approvals import verify
 
+from robocop.run import format_files
+
+from src.robocop_mcp.mcp_format import robocop_format
 from src.robocop_mcp.server import run_robocop_format
 
 
@@ -126,3 +132,48 @@ async def test_run_robocop_format_with_exception(tmp_path, test_1):
         result = await run_robocop_format(robot_file)
         mock_format_files.assert_called_once_with(sources=[robot_file], reruns=10)
         verify(result)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_robocop_format_calls_capture_own_output(tmp_path, monkeypatch, capsys):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_format_files(sources: list, **_: object) -> None:
+        sys.stdout.write(f"start {sources[0].name}\n")
+        barrier.wait()
+        sys.stderr.write(f"end {sources[0].name}\n")
+
+    first_file = tmp_path / "first.robot"
+    second_file = tmp_path / "second.robot"
+    with patch("src.robocop_mcp.mcp_format.format_files", side_effect=fake_format_files):
+        first, second = await asyncio.gather(robocop_format(first_file), robocop_format(second_file))
+    assert first == "start first.robot\nend first.robot"
+    assert second == "start second.robot\nend second.robot"
+    sys.stdout.write("not captured\n")
+    assert capsys.readouterr().out == "not captured\n"
+
+
+@pytest.mark.asyncio
+async def test_robocop_format_skips_files_not_changed_since_last_format(tmp_path, monkeypatch, test_1):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(3):
+        (suite / f"test_{index}.robot").write_text(test_1)
+    first = await robocop_format(suite)
+    assert first.endswith("3 files reformatted, 0 files left unchanged.")
+
+    with patch("src.robocop_mcp.mcp_format.format_files", wraps=format_files) as mock_format_files:
+        second = await robocop_format(suite)
+        mock_format_files.assert_not_called()
+        assert second == "3 files skipped, not changed since last format."
+
+        changed_file = suite / "test_1.robot"
+        changed_file.write_text(test_1)
+        third = await robocop_format(suite)
+        mock_format_files.assert_called_once()
+        assert mock_format_files.call_args.kwargs["sources"] == [changed_file.resolve()]
+    assert third.endswith(
+        "1 file reformatted, 0 files left unchanged.\n2 files skipped, not changed since last format."
+    )
@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+# Budget for importing the server module, measured with python -X importtime. Import takes
+# about 0.9 seconds, budget leaves headroom for slower machines. Loading of the rule modules
+# is checked separately.
+IMPORT_BUDGET_SECONDS = 1.5
+
+
+def _import_times(module: str) -> list[tuple[str, int]]:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times.append((name[1:].rstrip(), int(cumulative)))
+    return times
+
+
+def test_server_import_does_not_load_robocop_rules():
+    times = _import_times("src.robocop_mcp.server")
+    modules = [name.strip() for name, _ in times]
+    assert "src.robocop_mcp.server" in modules
+    assert "src.robocop_mcp.config" in modules
+    rule_modules = [module for module in modules if module.startswith("robocop.linter.rules.")]
+    assert rule_modules == []
+
+
+def test_server_import_is_within_startup_budget():
+    # Fastest of the runs is used, so that a slow run in a busy machine does not fail the test.
+    totals = []
+    for _ in range(3):
+        times = _import_times("src.robocop_mcp.server")
+        totals.append(sum(cumulative for name, cumulative in times if not name.startswith(" ")))
+    assert min(totals) / 1_000_000 < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,92 @@
+import dataclasses
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.robocop_mcp.mcp_check import Violation, convert_to_violations, _dump_violations, _load_violations
+
+DIAGNOSTIC_COUNT = 20000
+
+
+@dataclasses.dataclass
+class PlainViolation:
+    file: Path
+    start_line: int
+    end_line: int
+    start_column: int
+    end_column: int
+    severity: str
+    rule_id: str
+    description: str
+
+
+def _diagnostics() -> list[SimpleNamespace]:
+    # Robocop creates new strings for each diagnostic, so the values are built one by one here too.
+    return [
+        SimpleNamespace(
+            source=SimpleNamespace(path=f"/project/tests/suite_{index % 50}.robot"),
+            range=SimpleNamespace(
+                start=SimpleNamespace(line=index % 500 + 300, character=index % 80 + 1),
+                end=SimpleNamespace(line=index % 500 + 300, character=index % 80 + 300),
+            ),
+            severity=SimpleNamespace(name="WARNING"),
+            rule=SimpleNamespace(rule_id=f"DOC{index % 10:02}"),
+            message=f"Missing documentation in rule number {index % 10}",
+        )
+        for index in range(DIAGNOSTIC_COUNT)
+    ]
+
+
+def _plain_violations(diagnostics: list[SimpleNamespace]) -> list[PlainViolation]:
+    return [
+        PlainViolation(
+            Path(item.source.path),
+            item.range.start.line,
+            item.range.end.line,
+            item.range.start.character,
+            item.range.end.character,
+            "".join(item.severity.name),
+            "".join(item.rule.rule_id),
+            "".join(item.message),
+        )
+        for item in diagnostics
+    ]
+
+
+def _retained_memory(create, diagnostics: list[SimpleNamespace]) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = create(diagnostics)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(result) == DIAGNOSTIC_COUNT
+    return after - before
+
+
+def test_violation_is_slotted_and_immutable():
+    violation = Violation(Path("a.robot"), 1, 1, 1, 2, "WARNING", "DOC01", "Missing documentation")
+    assert not hasattr(violation, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        violation.rule_id = "DOC02"  # type: ignore[misc]
+
+
+def test_converted_violations_share_repeated_values():
+    violations = convert_to_violations(_diagnostics()[:100])
+    assert violations[0].file is violations[50].file
+    assert violations[0].description is violations[10].description
+    same_file = [violation for violation in violations if violation.file is violations[0].file]
+    loaded = _load_violations(violations[0].file, _dump_violations(same_file))
+    assert loaded == same_file
+    assert loaded[0].rule_id is violations[0].rule_id
+
+
+def test_violation_memory_benchmark():
+    diagnostics = _diagnostics()
+    plain = _retained_memory(_plain_violations, diagnostics)
+    compact = _retained_memory(convert_to_violations, diagnostics)
+    # Slots and shared values keep memory per violation less than a third of the plain dataclass.
+    assert compact * 3 < plain, f"{compact / DIAGNOSTIC_COUNT:.0f} vs {plain / DIAGNOSTIC_COUNT:.0f} bytes"
@@ -0,0 +1,106 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.robocop_mcp import mcp_check, watch
+from src.robocop_mcp.config import get_config
+from src.robocop_mcp.mcp_check import check_files_to_cache, run_robocop
+from src.robocop_mcp.watch import Watcher, find_watched_files
+
+
+def test_polling_watcher_reports_changes_in_one_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch, "watchfiles", None)
+    monkeypatch.setattr(watch, "POLL_INTERVAL", 0.05)
+    batches = []
+    received = threading.Event()
+
+    def on_change(files: list) -> None:
+        batches.append(files)
+        received.set()
+
+    (tmp_path / "existing.robot").write_text("*** Test Cases ***\n")
+    watcher = Watcher(tmp_path, 0.1, on_change)
+    watcher.start()
+    try:
+        (tmp_path / "first.robot").write_text("*** Test Cases ***\n")
+        (tmp_path / "second.resource").write_text("*** Keywords ***\n")
+        (tmp_path / "notes.txt").write_text("not watched")
+        assert received.wait(timeout=5)
+    finally:
+        watcher.stop()
+    assert batches == [[tmp_path / "first.robot", tmp_path / "second.resource"]]
+
+
+def test_event_watcher_reports_changes_in_one_batch(tmp_path):
+    pytest.importorskip("watchfiles")
+    batches = []
+    received = threading.Event()
+
+    def on_change(files: list) -> None:
+        batches.append(files)
+        received.set()
+
+    watcher = Watcher(tmp_path, 0.2, on_change)
+    watcher.start()
+    try:
+        # Watcher thread needs a moment to start receiving the file system events.
+        time.sleep(0.5)
+        (tmp_path / "first.robot").write_text("*** Test Cases ***\n")
+        (tmp_path / "second.resource").write_text("*** Keywords ***\n")
+        (tmp_path / "notes.txt").write_text("not watched")
+        assert received.wait(timeout=5)
+    finally:
+        watcher.stop()
+    assert batches == [[tmp_path / "first.robot", tmp_path / "second.resource"]]
+
+
+def test_get_config_watch_settings(tmp_path, monkeypatch):
+    toml_file = tmp_path / "pyproject.toml"
+    toml_file.write_text('[tool.robocop_mcp]\nwatch = true\nwatch_path = "tests"\nwatch_debounce = 200\n')
+    monkeypatch.setenv("ROBOCOPMCP_CONFIG_FILE", str(toml_file))
+    config = get_config()
+    assert config.watch is True
+    assert config.watch_path == (tmp_path / "tests").resolve()
+    assert config.watch_debounce == 200
+
+
+@pytest.mark.asyncio
+async def test_check_files_to_cache_fills_cache_for_run_robocop(tmp_path, monkeypatch, test_1, test_2):
+    monkeypatch.delenv("ROBOCOPMCP_CONFIG_FILE", raising=False)
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    (suite / "test_1.robot").write_text(test_1)
+    (suite / "test_2.robot").write_text(test_2)
+    check_files_to_cache([*find_watched_files(suite), suite / "removed.robot"])
+
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        result = await run_robocop(str(suite))
+        lint_files.assert_not_called()
+    assert {violation.file.name for violation in result} == {"test_1.robot", "test_2.robot"}
+
+
+def test_check_files_to_cache_uses_file_filters_and_batches(tmp_path, monkeypatch, robocop_mcp_toml, test_1):
+    robocop_mcp_toml('watch = true\nwatch_path = "suite"')
+    monkeypatch.setattr(mcp_check, "CHECK_BATCH_SIZE", 2)
+    suite = tmp_path / "suite"
+    for folder in ("tests", ".venv", "dist", "ignored"):
+        (suite / folder).mkdir(parents=True)
+    for index in range(5):
+        (suite / "tests" / f"test_{index}.robot").write_text(test_1)
+    (suite / ".venv" / "venv.robot").write_text(test_1)
+    (suite / "dist" / "dist.robot").write_text(test_1)
+    (suite / "ignored" / "ignored.robot").write_text(test_1)
+    (suite / ".gitignore").write_text("ignored/\n")
+    expected = sorted((suite / "tests").glob("*.robot"))
+
+    with patch.object(mcp_check, "lint_files", wraps=mcp_check.lint_files) as lint_files:
+        check_files_to_cache([suite])
+        checked = [call.kwargs["sources"] for call in lint_files.call_args_list]
+        assert sorted(file for batch in checked for file in batch) == expected
+        assert sorted(len(batch) for batch in checked) == [1, 2, 2]
+        lint_files.reset_mock()
+        # Changed files are filtered in the same way as the files of the watched folder.
+        check_files_to_cache([suite / "dist" / "dist.robot", suite / "ignored" / "ignored.robot"])
+        lint_files.assert_not_called()